@@ -0,0 +1,62 @@
+from enum import IntEnum
+from config import *
+
+class Direction(IntEnum):
+    DOWN = 0
+    UP = 1
+    LEFT = 2
+    RIGHT = 3
+
+class AnimState(IntEnum):
+    IDLE = 0
+    WALK = 1
+    ATTACK = 2
+
+# Unit vector for each direction, indexed by Direction
+DIRECTION_VECTORS = ((0, 1), (0, -1), (-1, 0), (1, 0))
+
+# Which movement component (0 = x_change, 1 = y_change) decides whether a sprite facing a direction is walking
+DIRECTION_AXIS = (1, 1, 0, 0)
+
+# Ticks each animation frame is held for, so playback speed doesn't depend on SIM_HZ
+WALK_FRAME_TICKS = max(1, round(10 / TICK_SCALE))
+ATTACK_FRAME_TICKS = max(1, round(2 / TICK_SCALE))
+
+# Frame index sequences per state, one entry per tick
+IDLE_SEQUENCE = (0,)
+WALK_SEQUENCE = (1,) * WALK_FRAME_TICKS + (2,) * WALK_FRAME_TICKS  # Frames 1 and 2, 1/6 s each
+ATTACK_SEQUENCE = tuple(frame for frame in range(5) for _ in range(ATTACK_FRAME_TICKS))  # Frames 0-4, 1/30 s each
+
+CHARACTER_SEQUENCES = {AnimState.IDLE: IDLE_SEQUENCE, AnimState.WALK: WALK_SEQUENCE}
+ATTACK_SEQUENCES = {AnimState.ATTACK: ATTACK_SEQUENCE}
+
+clip_cache = {}
+
+def build_clips(frames, sequences):
+    """Expand frame index sequences into shared per-state, per-direction tuples of surfaces"""
+    key = (frames, tuple(sequences.items()))
+    clips = clip_cache.get(key)
+    if clips is None:
+        clips = {state: tuple(tuple(direction_frames[i] for i in sequence) for direction_frames in frames)
+                 for state, sequence in sequences.items()}
+        clip_cache[key] = clips
+    return clips
+
+class Animator:
+    """Picks a sprite's image with one indexed lookup per tick from precomputed clips"""
+    def __init__(self, frames, sequences):
+        self.clips = build_clips(frames, sequences)
+        self.tick = 0
+        self.finished = False  # Set once a multi-frame clip has played through
+
+    def frame(self, direction, state):
+        """Return the image for this tick; single-frame (idle) clips do not advance the tick"""
+        clip = self.clips[state][direction]
+        if len(clip) == 1:
+            return clip[0]
+        image = clip[self.tick % len(clip)]
+        self.tick += 1
+        if self.tick >= len(clip):
+            self.tick = 0
+            self.finished = True
+        return image
@@ -0,0 +1,55 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from config import *
+
+def read_bytes(path):
+    """Read a whole file into memory so the main thread never touches the disk for it"""
+    with open(path, 'rb') as f:
+        return io.BytesIO(f.read())
+
+class AssetLoader:
+    """Decodes files on a thread pool; surfaces are converted on the main thread once every job is done"""
+    def __init__(self, workers=ASSET_LOADER_WORKERS):
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.jobs = {}  # Name -> (future, finish), finish runs on the main thread
+        self.assets = {}
+
+    def add(self, name, load, *args, finish=None):
+        """Queue load(*args) on the pool; finish(result) runs on the main thread when collected"""
+        self.jobs[name] = (self.pool.submit(load, *args), finish)
+
+    def add_image(self, name, path, alpha=False):
+        """Decode an image off the main thread, converting it to the display format afterwards"""
+        self.add(name, pygame.image.load, path,
+                 finish=pygame.Surface.convert_alpha if alpha else pygame.Surface.convert)
+
+    def add_file(self, name, path):
+        """Read a file (e.g. music) into an in-memory buffer"""
+        self.add(name, read_bytes, path)
+
+    def progress(self):
+        """Fraction of queued jobs that have finished"""
+        if not self.jobs:
+            return 1.0
+        return sum(future.done() for future, finish in self.jobs.values()) / len(self.jobs)
+
+    def wait(self, draw_progress, clock):
+        """Keep the window responsive and draw progress until every job is done, then finish them"""
+        while self.progress() < 1.0:
+            pygame.event.pump()
+            draw_progress(self.progress())
+            clock.tick(FPS)
+        draw_progress(1.0)
+        self.pool.shutdown()
+        for name, (future, finish) in self.jobs.items():
+            try:
+                asset = future.result()
+            except (pygame.error, OSError) as e:
+                print(f"Failed to load asset {name}: {e}")
+                asset = None
+            if asset is not None and finish:
+                asset = finish(asset)
+            self.assets[name] = asset
+        self.jobs = {}
+        return self.assets
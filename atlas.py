@@ -0,0 +1,91 @@
+# Build step: run `python atlas.py` after changing a spritesheet or the frame tables in sprite.py.
+# Regions missing from the built index are still sliced from the loose spritesheets at runtime.
+import json
+import os
+import pygame
+from config import *
+
+def region_name(file, x, y, width, height):
+    """Atlas index key for a region of a source sheet"""
+    return f'{file}:{x},{y},{width},{height}'
+
+class Atlas:
+    """Display-format atlas image plus its region index"""
+    def __init__(self, image, regions):
+        self.image = image
+        self.regions = regions  # Name -> {'rect': [x, y, w, h], 'colorkey': [r, g, b] or None, 'rle': bool}
+
+    @staticmethod
+    def read(image_path=ATLAS_IMAGE, index_path=ATLAS_INDEX):
+        """Decode the atlas image and index without converting (safe off the main thread); None if not built"""
+        if not (os.path.exists(image_path) and os.path.exists(index_path)):
+            return None
+        with open(index_path) as f:
+            regions = json.load(f)['regions']
+        return pygame.image.load(image_path), regions
+
+    @classmethod
+    def from_data(cls, data):
+        """Finish a read() on the main thread by converting the image to the display format"""
+        image, regions = data
+        return cls(image.convert(), regions)
+
+    def __contains__(self, name):
+        return name in self.regions
+
+    def get_frame(self, name):
+        """Copy a region into its own surface with the colorkey (and RLE acceleration) from the index"""
+        region = self.regions[name]
+        x, y, width, height = region['rect']
+        frame = pygame.Surface((width, height)).convert()
+        frame.blit(self.image, (0, 0), (x, y, width, height))
+        if region['colorkey'] is not None:
+            frame.set_colorkey(region['colorkey'], pygame.RLEACCEL if region['rle'] else 0)
+        return frame
+
+def pack(sizes, max_width):
+    """Shelf-pack (width, height) boxes, tallest first; return their positions and the atlas size"""
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True)
+    positions = [None] * len(sizes)
+    x = y = shelf_height = atlas_width = 0
+    for i in order:
+        width, height = sizes[i]
+        if x + width > max_width:
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+        positions[i] = (x, y)
+        x += width
+        shelf_height = max(shelf_height, height)
+        atlas_width = max(atlas_width, x)
+    return positions, (atlas_width, y + shelf_height)
+
+def build(image_path=ATLAS_IMAGE, index_path=ATLAS_INDEX, max_width=ATLAS_MAX_WIDTH):
+    """Pack every used spritesheet region into one image and write its index"""
+    from sprite import SHEET_REGIONS
+
+    names = []
+    sources = []
+    for file, frame_table in SHEET_REGIONS.items():
+        sheet = pygame.image.load(file)
+        for positions in frame_table:
+            for x, y in positions:
+                name = region_name(file, x, y, TILESIZE, TILESIZE)
+                if name not in names:
+                    names.append(name)
+                    sources.append((sheet, pygame.Rect(x, y, TILESIZE, TILESIZE)))
+
+    positions, size = pack([rect.size for sheet, rect in sources], max_width)
+    atlas = pygame.Surface(size)
+    regions = {}
+    for name, (sheet, rect), (x, y) in zip(names, sources, positions):
+        atlas.blit(sheet, (x, y), rect)
+        regions[name] = {'rect': [x, y, rect.width, rect.height], 'colorkey': list(BLACK), 'rle': True}
+
+    pygame.image.save(atlas, image_path)
+    with open(index_path, 'w') as f:
+        json.dump({'regions': regions}, f, indent=1)
+    print(f"Packed {len(regions)} regions from {len(SHEET_REGIONS)} sheets into {image_path} ({size[0]}x{size[1]})")
+
+if __name__ == '__main__':
+    build()
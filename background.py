@@ -0,0 +1,90 @@
+import queue
+import threading
+import pygame
+from config import *
+
+class AnimatedBackground:
+    """Animated GIF background decoded and scaled lazily on a worker thread"""
+    def __init__(self, path, size, buffer_frames=INTRO_BUFFER_FRAMES):
+        self.path = path
+        self.size = size
+        self.buffer_frames = buffer_frames
+        self.frames = None  # Bounded queue of (surface, duration) ready to show
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.image = None
+        self.duration = 100
+        self.timer = 0
+
+    def start(self):
+        """Begin decoding frames in the background"""
+        if self.thread:
+            return
+        self.frames = queue.Queue(maxsize=self.buffer_frames)
+        self.stop_event.clear()
+        self.timer = 0
+        self.thread = threading.Thread(target=self.decode_frames, daemon=True)
+        self.thread.start()
+
+    def decode_frames(self):
+        """Worker loop: decode, scale and enqueue frames, rewinding at the end of the GIF"""
+        from PIL import Image  # Imported here so startup never pays for PIL, and on this worker thread
+        try:
+            gif = Image.open(self.path)
+        except OSError as e:
+            print(f"Failed to load background {self.path}: {e}")
+            return
+        with gif:
+            while not self.stop_event.is_set():
+                frame = gif.convert('RGBA')
+                pygame_frame = pygame.image.fromstring(frame.tobytes(), frame.size, 'RGBA')
+                # Scale the frame to fill the screen
+                pygame_frame = pygame.transform.scale(pygame_frame, self.size)
+                duration = gif.info.get('duration', 100)  # Frame duration in ms, default 100
+                self.put((pygame_frame, duration))
+                try:
+                    gif.seek(gif.tell() + 1)
+                except EOFError:
+                    gif.seek(0)
+
+    def put(self, item):
+        """Block until there is room in the ring, giving up if playback stops"""
+        while not self.stop_event.is_set():
+            try:
+                self.frames.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def next_frame(self):
+        """Swap in the next decoded frame if the worker has one ready"""
+        try:
+            surface, self.duration = self.frames.get_nowait()
+        except queue.Empty:
+            return
+        self.image = surface.convert()  # Convert once per frame on the main thread, not every tick
+
+    def update(self, dt):
+        """Advance playback by dt milliseconds"""
+        if self.frames is None:
+            return
+        self.timer += dt
+        if self.image is None or self.timer >= self.duration:
+            self.timer = 0
+            self.next_frame()
+
+    def draw(self, screen):
+        """Draw the current frame, or black until the first one is ready"""
+        if self.image:
+            screen.blit(self.image, (0, 0))
+        else:
+            screen.fill(BLACK)
+
+    def close(self):
+        """Stop the worker and release every decoded frame"""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+        self.frames = None
+        self.image = None
@@ -0,0 +1,100 @@
+import math
+from config import *
+
+def snap(value):
+    """Round away float drift so a box that is meant to sit flush with a tile edge really does"""
+    nearest = round(value)
+    return nearest if abs(value - nearest) < COLLISION_EPSILON else value
+
+class TileGrid:
+    """Solid flag per tile, so a collision check only looks at the cells a rect overlaps"""
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+        self.solid = bytearray(cols * rows)  # 1 = blocks movement, row-major
+        self.version = 0  # Bumped whenever a tile opens or closes so path caches know to rebuild
+        self.changes = []  # (col, row) of every tile opened or closed, in order, for caches that rebuild locally
+
+    @classmethod
+    def from_tiles(cls, tiles, solid_chars=SOLID_TILES):
+        """Build the grid from tilemap rows"""
+        grid = cls(len(tiles[0]), len(tiles))
+        for row, line in enumerate(tiles):
+            for col, char in enumerate(line):
+                if char in solid_chars:
+                    grid.solid[row * grid.cols + col] = 1
+        return grid
+
+    def is_solid(self, col, row):
+        """Check a tile; everything outside the map counts as wall"""
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.solid[row * self.cols + col] == 1
+        return True
+
+    def set_solid(self, col, row, solid=True):
+        """Open or close a single tile"""
+        if 0 <= col < self.cols and 0 <= row < self.rows and self.solid[row * self.cols + col] != solid:
+            self.solid[row * self.cols + col] = 1 if solid else 0
+            self.version += 1
+            self.changes.append((col, row))
+
+    def sweep(self, x, y, width, height, dx, dy):
+        """Time of impact in [0, 1] of a box moving by (dx, dy), the axis it hits on and the box coordinate on that axis at contact"""
+        first_col = math.floor(min(x, x + dx) / TILESIZE)
+        last_col = math.ceil(max(x, x + dx) / TILESIZE + width / TILESIZE) - 1
+        first_row = math.floor(min(y, y + dy) / TILESIZE)
+        last_row = math.ceil(max(y, y + dy) / TILESIZE + height / TILESIZE) - 1
+
+        toi = 1.0
+        axis = None
+        contact = None
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                if not self.is_solid(col, row):
+                    continue
+                left = col * TILESIZE
+                top = row * TILESIZE
+                entry_x, exit_x = self.axis_times(x, width, dx, left)
+                entry_y, exit_y = self.axis_times(y, height, dy, top)
+                entry = max(entry_x, entry_y)
+                if entry >= exit_x or entry >= exit_y or entry < 0 or entry >= toi:
+                    continue
+                toi = entry
+                if entry_x >= entry_y:
+                    axis = 'x'
+                    contact = left - width if dx > 0 else left + TILESIZE
+                else:
+                    axis = 'y'
+                    contact = top - height if dy > 0 else top + TILESIZE
+        return toi, axis, contact
+
+    def axis_times(self, pos, size, delta, tile_pos):
+        """Entry and exit times along one axis against a tile; a box that never overlaps it gets an empty interval"""
+        if delta > 0:
+            return (tile_pos - (pos + size)) / delta, (tile_pos + TILESIZE - pos) / delta
+        if delta < 0:
+            return (tile_pos + TILESIZE - pos) / delta, (tile_pos - (pos + size)) / delta
+        if pos + size <= tile_pos or pos >= tile_pos + TILESIZE:
+            return math.inf, -math.inf
+        return -math.inf, math.inf
+
+    def move(self, x, y, width, height, dx, dy):
+        """Move a box by (dx, dy) without passing through walls, sliding along the ones it hits; return its new position"""
+        for _ in range(2):  # A hit removes one axis, so two sweeps finish any move
+            if not dx and not dy:
+                break
+            toi, axis, contact = self.sweep(x, y, width, height, dx, dy)
+            x += dx * toi
+            y += dy * toi
+            if axis is None:
+                break
+            # Snap flush against the wall, then spend the rest of the step along the other axis
+            if axis == 'x':
+                x = contact
+                dx = 0
+                dy *= 1 - toi
+            else:
+                y = contact
+                dy = 0
+                dx *= 1 - toi
+        return snap(x), snap(y)
@@ -1,7 +1,14 @@
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 TILESIZE = 32
-FPS = 60
+FPS = 60  # Render rate cap
+SIM_HZ = 60  # Fixed simulation rate; speeds, cooldowns and animation timings below scale with it
+SIM_DT = 1 / SIM_HZ
+TICK_SCALE = 60 / SIM_HZ  # Per-tick amounts were tuned at 60 ticks per second
+MAX_FRAME_TIME = 0.25  # Longest frame the simulation catches up on, so a stall can't spiral
+DIRTY_RECT_RENDERING = False  # Opt-in: redraw and present only changed screen regions
+FIXED_RENDER_RESOLUTION = False  # Opt-in: render at SCREEN_WIDTH x SCREEN_HEIGHT and upscale to the display
+INTEGER_SCALING = False  # With a fixed resolution, scale by whole factors only instead of nearest-neighbour stretch
 
 PLAYER_LAYER = 4
 ENEMY_LAYER = 3
@@ -9,9 +16,74 @@ BLOCK_LAYER = 2
 GROUND_LAYER = 1
 ITEM_LAYER = 0
 TREASURE_LAYER = 1
+Y_SORT_LAYERS = (ENEMY_LAYER,)  # Layers drawn back-to-front by sprite bottom edge
 
-PLAYER_SPEED = 5
-ENEMY_SPEED = 2
+PLAYER_SPEED = 5 * TICK_SCALE  # Pixels per tick
+ENEMY_SPEED = 2 * TICK_SCALE
+
+# Terrain Constants
+TERRAIN_CHUNK_TILES = 16  # Tiles per side of each pre-baked terrain chunk
+GROUND_TILE = (64, 352)   # Ground tile position in terrain2.png
+BLOCK_TILE = (960, 448)   # Wall tile position in terrain2.png
+SOLID_TILES = 'BQ'  # Tilemap characters that block movement: walls and closed question barriers
+COLLISION_EPSILON = 1e-6  # Positions this close to a whole pixel are snapped onto it
+
+# Spatial Hash Constants (collision layers are bit flags, combined into query masks)
+SPATIAL_CELL_SIZE = TILESIZE * 4
+COLLIDE_ENEMY = 1
+COLLIDE_ITEM = 2
+COLLIDE_CHEST = 4
+COLLIDE_ATTACK = 8
+COLLIDE_ALL = COLLIDE_ENEMY | COLLIDE_ITEM | COLLIDE_CHEST | COLLIDE_ATTACK
+
+# Simulation LOD Constants (margins are measured outward from the camera view)
+LOD_ACTIVE_MARGIN = TILESIZE * 4  # Enemies this close update every tick
+LOD_FAR_MARGIN = TILESIZE * 16  # Enemies out to here update every LOD_FAR_INTERVAL ticks; beyond it they are dormant
+LOD_FAR_INTERVAL = 4
+
+# Pathfinding Constants
+FLOW_FIELD_RADIUS = 12  # Path steps the flow field searches out from the player's tile
+ENEMY_DETECTION_STEPS = 8  # Enemies chase when their path to the player is at most this many tiles
+DEVIL_HUNT_RANGE = 16  # Devils that have seen the player keep hunting them within this many tiles, beyond the flow field
+HPA_CLUSTER_TILES = 10  # Side of each hierarchical pathfinding cluster
+HPA_PATH_CACHE_SIZE = 64  # Cluster-to-cluster routes kept, least recently used dropped first
+SIGHT_CACHE_SIZE = 4096  # Memoised line-of-sight results kept before the cache starts over
+AI_THINK_BUDGET_MS = 2.0  # Time per tick for enemy decisions; the rest wait their turn on later ticks
+AI_BATCH_MIN_SIZE = 100  # Enemies due in one tick before their steering is vectorized with NumPy (if installed)
+
+# Interaction Constants
+INTERACTION_TILE_RADIUS = 1  # Chests and barriers react within this many tiles of the player
+
+# Minimap Constants
+MINIMAP_ENABLED = True
+MINIMAP_TILE_SIZE = 3  # Pixels per tile
+MINIMAP_MARGIN = 10
+MINIMAP_ENEMY_RADIUS = 12  # Only enemies within this many tiles of the player are marked
+MINIMAP_FLOOR_COLOR = (40, 40, 40)
+MINIMAP_WALL_COLOR = (150, 150, 150)
+MINIMAP_BORDER_COLOR = (200, 200, 200)
+MINIMAP_PLAYER_COLOR = (0, 255, 0)
+MINIMAP_ENEMY_COLOR = (255, 0, 0)
+MINIMAP_CHEST_COLOR = (255, 215, 0)
+
+# Fog of War Constants
+FOG_OF_WAR = False  # Opt-in: only tiles in the player's line of sight are revealed
+FOG_RADIUS = 8  # Sight radius in tiles
+FOG_EXPLORED_ALPHA = 160  # Darkness over explored tiles that are out of sight (unexplored tiles are black)
+
+# Intro Background Constants
+INTRO_BACKGROUND = 'img/introbackground3.gif'
+INTRO_BUFFER_FRAMES = 4  # Decoded frames kept ready ahead of playback
+
+# Asset Loading Constants
+ASSET_LOADER_WORKERS = 4  # Threads decoding images and reading files at startup
+BACKGROUND_MUSIC = 'Music/background_music.mp3'
+LOADING_BAR_SIZE = (400, 20)
+
+# Sprite Atlas Constants (built offline by `python atlas.py`)
+ATLAS_IMAGE = 'img/atlas.png'
+ATLAS_INDEX = 'img/atlas.json'
+ATLAS_MAX_WIDTH = 512
 
 RED = (255, 0, 0)
 BLACK = (0, 0, 0)
@@ -29,7 +101,7 @@ MAX_MANA = 180
 HP_REGEN_RATE = 1
 MANA_REGEN_RATE = 2
 ATTACK_MANA_COST = 10
-DAMAGE_COOLDOWN = 120  # 2 seconds at 60 FPS (120 frames)
+DAMAGE_COOLDOWN = 2 * SIM_HZ  # 2 seconds in simulation ticks
 
 # Inventory System Constants
 INVENTORY_MAX_SLOTS = 20
@@ -82,6 +154,7 @@ MENU_BUTTON_HEIGHT = 50
 MENU_BUTTON_SPACING = 20
 MENU_TITLE_FONT_SIZE = 24
 MENU_BUTTON_FONT_SIZE = 16
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept in the LRU cache
 
 # Question Barrier Constants
 QUESTION_TEXT = "I speak without a mouth and hear without ears. I have no body, but I come alive with wind. What am I?"
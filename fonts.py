@@ -0,0 +1,44 @@
+import functools
+import pygame
+from config import *
+
+fonts = {}  # (face, size) -> shared pygame Font
+
+def get_font(face, size):
+    """Return the shared Font for a face and size, parsing the font file only once"""
+    key = (face, size)
+    font = fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()  # Deferred until the first font is needed
+        font = fonts[key] = pygame.font.Font(face, size)
+    return font
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def render_text(font, text, color, antialias=False):
+    """Render text once per (font, text, color, antialias); the surface is shared, so never draw on it"""
+    return font.render(text, antialias, color)
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def wrap_text(font, text, width):
+    """Split text into lines no wider than width pixels, breaking on spaces"""
+    lines = []
+    line = ''
+    for word in text.split():
+        candidate = f'{line} {word}' if line else word
+        if line and font.size(candidate)[0] > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    if line:
+        lines.append(line)
+    return tuple(lines)
+
+def blit_wrapped(surface, font, text, color, width, centerx, top, antialias=False):
+    """Draw word-wrapped, centered text and return the y coordinate below the last line"""
+    for line in wrap_text(font, text, width):
+        line_text = render_text(font, line, color, antialias)
+        surface.blit(line_text, line_text.get_rect(centerx=centerx, top=top))
+        top += font.get_linesize()
+    return top
@@ -0,0 +1,123 @@
+import pygame
+from config import *
+
+# Multipliers that map the shadowcasting octant (dx, dy) into grid offsets
+OCTANTS = (
+    (1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+    (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1),
+)
+
+UNEXPLORED = 0
+EXPLORED = 1
+VISIBLE = 2
+
+DARKNESS_ALPHA = (255, FOG_EXPLORED_ALPHA, 0)  # Mask alpha per cell state
+
+class FogOfWar:
+    """Line-of-sight fog using shadowcasting over the wall grid, recomputed only on tile changes"""
+    def __init__(self, game, terrain, radius=FOG_RADIUS):
+        self.game = game
+        self.terrain = terrain
+        self.radius = radius
+        self.cols = terrain.cols
+        self.rows = terrain.rows
+        self.cells = bytearray(self.cols * self.rows)  # UNEXPLORED / EXPLORED / VISIBLE per tile, row-major
+        self.lit = []  # Cell indices the last cast made VISIBLE, so only they need demoting next time
+
+        self.origin = None
+        self.built_version = None
+        self.mask_pixels = bytearray(len(self.cells) * 4)  # RGBA buffer backing the mask surface
+        self.mask_pixels[3::4] = bytes([DARKNESS_ALPHA[UNEXPLORED]]) * len(self.cells)
+        self.mask = None  # One pixel per tile, alpha = darkness; shares mask_pixels, created on the first update
+        self.darkness = None  # Mask window scaled to tile size around the camera
+        self.darkness_rect = None  # Tile rect the cached darkness covers
+
+    def is_opaque(self, col, row):
+        """Solid tiles and everything outside the map block sight"""
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.terrain.tiles[row][col] in SOLID_TILES
+        return True
+
+    def update(self, col, row):
+        """Recompute visibility if the viewer moved to another tile or the map changed; return True if it did"""
+        if (col, row) == self.origin and self.built_version == self.terrain.version:
+            return False
+        self.origin = (col, row)
+        self.built_version = self.terrain.version
+
+        previous = self.lit
+        for index in previous:
+            self.cells[index] = EXPLORED
+        self.lit = []
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            self.light(row * self.cols + col)
+        for xx, xy, yx, yy in OCTANTS:
+            self.cast_light(col, row, 1, 1.0, 0.0, xx, xy, yx, yy)
+
+        # Only cells lit by the last cast or this one can have changed state
+        for index in previous + self.lit:
+            self.mask_pixels[index * 4 + 3] = DARKNESS_ALPHA[self.cells[index]]
+        if self.mask is None:
+            self.mask = pygame.image.frombuffer(self.mask_pixels, (self.cols, self.rows), 'RGBA')
+        self.darkness = None
+        return True
+
+    def light(self, index):
+        """Mark a cell VISIBLE, remembering it for the next demotion"""
+        if self.cells[index] != VISIBLE:
+            self.cells[index] = VISIBLE
+            self.lit.append(index)
+
+    def cast_light(self, origin_col, origin_row, start_row, start_slope, end_slope, xx, xy, yx, yy):
+        """Recursive shadowcasting over one octant"""
+        if start_slope < end_slope:
+            return
+        radius_sq = self.radius * self.radius
+        new_start = start_slope
+        for distance in range(start_row, self.radius + 1):
+            dx = -distance - 1
+            dy = -distance
+            blocked = False
+            while dx <= 0:
+                dx += 1
+                col = origin_col + dx * xx + dy * xy
+                row = origin_row + dx * yx + dy * yy
+                left_slope = (dx - 0.5) / (dy + 0.5)
+                right_slope = (dx + 0.5) / (dy - 0.5)
+                if start_slope < right_slope:
+                    continue
+                if end_slope > left_slope:
+                    break
+
+                if dx * dx + dy * dy <= radius_sq and 0 <= col < self.cols and 0 <= row < self.rows:
+                    self.light(row * self.cols + col)
+
+                opaque = self.is_opaque(col, row)
+                if blocked:
+                    if opaque:
+                        new_start = right_slope
+                    else:
+                        blocked = False
+                        start_slope = new_start
+                elif opaque and distance < self.radius:
+                    # Wall starts a shadow: scan the lit part beyond it, then continue past the wall
+                    blocked = True
+                    self.cast_light(origin_col, origin_row, distance + 1, start_slope, left_slope, xx, xy, yx, yy)
+                    new_start = right_slope
+            if blocked:
+                break
+
+    def draw(self, screen, camera):
+        """Blit the darkness for the tiles under the camera, rescaling only when visibility or the tile window changed"""
+        if self.mask is None:
+            return
+        window = pygame.Rect(camera.x // TILESIZE, camera.y // TILESIZE,
+                             camera.width // TILESIZE + 2, camera.height // TILESIZE + 2)
+        window = window.clip(self.mask.get_rect())
+        if not window.width or not window.height:
+            return
+        if self.darkness is None or window != self.darkness_rect:
+            darkness = pygame.transform.scale(self.mask.subsurface(window), (window.width * TILESIZE, window.height * TILESIZE))
+            self.darkness = darkness.convert_alpha()
+            self.darkness_rect = window
+        screen.blit(self.darkness, (window.x * TILESIZE - camera.x, window.y * TILESIZE - camera.y))
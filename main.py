@@ -1,67 +1,79 @@
+from startup import profile
 import pygame
-from sprite import *
-from config import *
 import sys
 import os
+import time
 from datetime import datetime
-from inventory import *
-from PIL import Image
+profile.mark('import pygame')
+from config import *
+from sprite import Spritesheet, Player, Enemy, Devil, Button, Attack, ItemSprite, TreasureChest, QuestionBarrier
+from animation import DIRECTION_VECTORS
+from atlas import Atlas
+from inventory import Inventory, HealthPotion, ManaPotion, Weapon, Collectible
+from fonts import get_font, render_text
+from terrain import TerrainRenderer
+from collision import TileGrid
+from spatial import SpatialHash
+from triggers import TriggerMap
+from pathfinding import FlowField, HierarchicalPathfinder
+from steering import SteeringBatch
+from scheduler import AIScheduler
+from sight import SightLines
+from render import RenderQueue, DirtyRectTracker, Presenter, merge_rects
+from minimap import Minimap
+from fov import FogOfWar
+from ui import HudOverlay, InventoryOverlay, MenuOverlay, QuestionOverlay
+from background import AnimatedBackground
+from assets import AssetLoader
+profile.mark('import game modules')
 
 class Game:
     def __init__(self):
-        pygame.init()
+        # Only the display module starts here; the font and mixer modules initialise on first use
+        pygame.display.init()
         # Get display info for fullscreen resolution
         display_info = pygame.display.Info()
+        native_size = (display_info.current_w, display_info.current_h)
         global SCREEN_WIDTH, SCREEN_HEIGHT
-        SCREEN_WIDTH = display_info.current_w
-        SCREEN_HEIGHT = display_info.current_h
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if FIXED_RENDER_RESOLUTION:
+            # Draw into a fixed logical surface (size from config.py) and scale it to the display once per frame
+            self.display = pygame.display.set_mode(native_size)
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        else:
+            SCREEN_WIDTH, SCREEN_HEIGHT = native_size
+            self.display = self.screen = pygame.display.set_mode(native_size)
+        self.presenter = Presenter(self.display, self.screen)
         self.clock = pygame.time.Clock()
         self.running = True
-        self.font = pygame.font.Font('darkbyte.ttf', 16)
+        profile.mark('display init')
+        self.font = get_font('darkbyte.ttf', 16)
+        profile.mark('font init')
 
         # Camera system
         self.camera = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.prev_camera = self.camera.topleft  # Camera position at the start of the current tick
+        self.draw_camera = self.camera  # Camera interpolated for the frame being drawn
+        self.alpha = 1.0  # How far between the last two ticks this frame is drawn
 
         self.character_spritesheet = Spritesheet('img/knight.png')
         self.terrain_spritesheet = Spritesheet('img/terrain2.png')
         self.enemy_spritesheet = Spritesheet('img/zombie.png')
         self.attack_spritesheet = Spritesheet('img/attack.png')
         self.chest_spritesheet = Spritesheet('img/chest.png')
-        # Load animated GIF frames
-        self.intro_background_frames = []
-        self.intro_background_durations = []
-        self.intro_background_frame = 0
-        self.intro_background_timer = 0
-
-        gif = Image.open('img/introbackground3.gif')
-        try:
-            while True:
-                frame = gif.convert('RGBA')
-                pygame_frame = pygame.image.fromstring(frame.tobytes(), frame.size, 'RGBA')
-                # Scale the frame to fill the screen
-                pygame_frame = pygame.transform.scale(pygame_frame, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                self.intro_background_frames.append(pygame_frame)
-                duration = gif.info.get('duration', 100)  # Get frame duration in ms, default 100
-                self.intro_background_durations.append(duration)
-                gif.seek(gif.tell() + 1)
-        except EOFError:
-            pass
-        gif.close()
-
-        if self.intro_background_frames:
-            self.intro_background = self.intro_background_frames[0]
-        else:
-            self.intro_background = pygame.transform.scale(pygame.image.load('img/introbackground3.gif'), (SCREEN_WIDTH, SCREEN_HEIGHT))  # fallback scaled
-        self.go_background = pygame.image.load('img/gameover.png')
         self.devil_spritesheet = Spritesheet('img/devil.png')
-        pygame.mixer.music.load("Music/background_music.mp3")
-        pygame.mixer.music.play(-1)
+        # Animated menu background; its worker starts decoding now so the menu opens on a ready frame
+        self.intro_background = AnimatedBackground(INTRO_BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.intro_background.start()
+        self.first_frame_reported = False
+        self.load_assets()
 
         # Inventory system
         self.inventory = Inventory(INVENTORY_MAX_SLOTS)
         self.show_inventory = False
 
+        # Minimap overlay (toggled with TAB)
+        self.show_minimap = MINIMAP_ENABLED
+
         # In-game menu system
         self.show_menu = False
         self.music_paused = False
@@ -73,24 +85,90 @@ class Game:
         self.question_barrier = None
         self.selected_option = 0
 
+        # Cached UI overlays, re-composed only when what they show changes
+        self.hud_overlay = HudOverlay(self)
+        self.inventory_overlay = InventoryOverlay(self)
+        self.menu_overlay = MenuOverlay(self)
+        self.question_overlay = QuestionOverlay(self)
+        self.menu_buttons = self.menu_overlay.button_rects
+        profile.mark('game setup')
+        profile.report()
+
+    def load_assets(self):
+        """Decode images and read the music on worker threads behind a progress bar"""
+        loader = AssetLoader()
+        # One read of the packed atlas replaces loading each spritesheet
+        loader.add('atlas', Atlas.read, finish=Atlas.from_data)
+        sheets = (self.character_spritesheet, self.terrain_spritesheet, self.enemy_spritesheet,
+                  self.attack_spritesheet, self.chest_spritesheet, self.devil_spritesheet)
+        if not os.path.exists(ATLAS_IMAGE):
+            for sheet in sheets:
+                loader.add_image(sheet.file, sheet.file)
+        loader.add_image('gameover', 'img/gameover.png')
+        loader.add_file('music', BACKGROUND_MUSIC)
+
+        assets = loader.wait(self.draw_loading, self.clock)
+        Spritesheet.atlas = assets.get('atlas')
+        for sheet in sheets:
+            sheet.sheet = assets.get(sheet.file)
+        self.go_background = assets['gameover']
+        profile.mark('asset loading')
+        if assets['music']:
+            self.start_music(assets['music'])
+        profile.mark('audio init')
+
+    def draw_loading(self, progress):
+        """Lightweight loading screen: a label and a progress bar"""
+        self.screen.fill(BLACK)
+        bar = pygame.Rect((0, 0), LOADING_BAR_SIZE)
+        bar.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        label = render_text(self.font, 'Loading...', WHITE)
+        self.screen.blit(label, label.get_rect(midbottom=(bar.centerx, bar.top - 10)))
+        pygame.draw.rect(self.screen, WHITE, bar, 1)
+        self.screen.fill(WHITE, (bar.x + 2, bar.y + 2, round((bar.width - 4) * progress), bar.height - 4))
+        self.presenter.present()
+        self.report_first_frame()
+
+    def report_first_frame(self):
+        """Mark time-to-first-frame in the startup profile once, when anything is first shown"""
+        if not self.first_frame_reported:
+            self.first_frame_reported = True
+            profile.mark('first frame')
+
     def createTilemap(self):
+        # Ground and wall images are static, so they are baked into chunks instead of drawn as sprites
+        self.terrain = TerrainRenderer(self, tilemap)
+        # Walls are looked up by tile for collision instead of being sprites
+        self.grid = TileGrid.from_tiles(tilemap)
+        # Shared shortest-path map toward the player, re-searched only when the player changes tile
+        self.flow_field = FlowField(self.grid)
+        # Cluster-level routes for enemies hunting beyond the flow field
+        self.pathfinder = HierarchicalPathfinder(self.grid)
+        # Whether enemies can see the player's tile, memoised until walls change
+        self.sight = SightLines(self.grid)
+        self.minimap = Minimap(self, self.terrain)
+        self.fog = FogOfWar(self, self.terrain)
         for i, row in enumerate(tilemap):
             for j, col in enumerate(row):
-                Ground(self, j, i)
-                if col == 'B':
-                    Block(self, j, i)
                 if col == 'E':
                     Enemy(self, j, i)
                 if col == "D":
                     Devil(self, j ,i) 
                 if col == 'P':
                     self.player = Player(self, j, i)
+                if col == 'Q':
+                    QuestionBarrier(self, j, i)  # Solid until its riddle is answered
                 if col == 'T':
                     TreasureChest(self, j, i)  # Spawn treasure chest
                 # Spawn items based on tilemap characters
                 elif col in ITEM_CHARS:
                     self.spawn_item(j, i, col)
 
+    def set_tile(self, col, row, char):
+        """Change one tilemap cell at runtime; cached views rebuild from terrain.version"""
+        self.terrain.set_tile(col, row, char)
+        self.grid.set_solid(col, row, char in SOLID_TILES)
+
     def spawn_item(self, x, y, item_char):
         """Spawn an item at the specified location"""
         # Create appropriate item based on character
@@ -115,13 +193,20 @@ class Game:
         # Hide mouse cursor during gameplay
         pygame.mouse.set_visible(False)
 
-        self.all_sprites = pygame.sprite.LayeredUpdates()
-        self.blocks = pygame.sprite.LayeredUpdates()
-        self.enemies = pygame.sprite.LayeredUpdates()
-        self.devil = pygame.sprite.LayeredUpdates()
-        self.attacks = pygame.sprite.LayeredUpdates()
-        self.items = pygame.sprite.LayeredUpdates()  # Item sprites
-        self.treasure_chests = pygame.sprite.LayeredUpdates()  # Treasure chests
+        # all_sprites keeps per-layer draw lists; the other groups never draw, so plain groups are enough
+        self.all_sprites = RenderQueue(y_sort_layers=Y_SORT_LAYERS)
+        self.enemies = pygame.sprite.Group()
+        self.devil = pygame.sprite.Group()
+        self.attacks = pygame.sprite.Group()
+        self.items = pygame.sprite.Group()  # Item sprites
+        self.treasure_chests = pygame.sprite.Group()  # Treasure chests
+        self.spatial = SpatialHash()  # Enemies, items, chests and attacks bucketed for proximity queries
+        self.triggers = TriggerMap()  # Interaction volumes, checked only when the player changes tile
+        self.prompt_chest = None  # Unopened chest whose volume the player is in
+        self.tick_count = 0
+        self.ai_scheduler = AIScheduler()  # Enemy decisions under a per-tick time budget
+        self.steering = SteeringBatch()  # Enemy movement for all enemies due in a tick
+        self.dirty_rects = DirtyRectTracker()
 
         self.createTilemap()
 
@@ -137,14 +222,12 @@ class Game:
                     # Check if player has enough mana to attack
                     if self.player.can_attack():
                         self.player.use_mana(ATTACK_MANA_COST)
-                        if self.player.facing == 'up':
-                            Attack(self, self.player.rect.x, self.player.rect.y - TILESIZE)
-                        if self.player.facing == 'down':
-                            Attack(self, self.player.rect.x, self.player.rect.y + TILESIZE)
-                        if self.player.facing == 'left':
-                            Attack(self, self.player.rect.x - TILESIZE, self.player.rect.y)
-                        if self.player.facing == 'right':
-                            Attack(self, self.player.rect.x + TILESIZE, self.player.rect.y)
+                        # Spawn the attack one tile ahead of the player
+                        dx, dy = DIRECTION_VECTORS[self.player.facing]
+                        Attack(self, self.player.rect.x + dx * TILESIZE, self.player.rect.y + dy * TILESIZE)
+                elif event.key == pygame.K_TAB:
+                    # Toggle minimap display
+                    self.show_minimap = not self.show_minimap
                 elif event.key == pygame.K_i:
                     # Toggle inventory display
                     self.show_inventory = not self.show_inventory
@@ -156,6 +239,8 @@ class Game:
                     # Use mana potion
                     if self.inventory.use_mana_potion(self.player):
                         pass  # Potion used successfully
+                elif event.key == pygame.K_e and not (self.show_menu or self.show_question_ui):
+                    self.triggers.interact()  # Handed to whichever trigger volume the player stands in
                 elif event.key == pygame.K_ESCAPE:
                     # Toggle in-game menu
                     self.show_menu = not self.show_menu
@@ -194,7 +279,7 @@ class Game:
 
             if event.type == pygame.MOUSEBUTTONDOWN and self.show_menu:
                 if event.button == 1:  # Left mouse button
-                    mouse_pos = pygame.mouse.get_pos()
+                    mouse_pos = self.mouse_pos()
                     for i, button_rect in enumerate(self.menu_buttons):
                         if button_rect.collidepoint(mouse_pos):
                             if i == 0:  # Save Game
@@ -209,9 +294,40 @@ class Game:
                             break
 
     def update(self):
-        #game loop updates
-        self.all_sprites.update()
+        #game loop updates, one fixed SIM_DT tick
+        self.prev_camera = self.camera.topleft
+        self.tick_count += 1
+        self.player.update()
+
+        # Paths, triggers and visibility only change when the player enters another tile
+        player_col = self.player.rect.centerx // TILESIZE
+        player_row = self.player.rect.centery // TILESIZE
+        self.flow_field.update(player_col, player_row)
+        self.update_entities()
         self.update_camera()
+        self.triggers.update(player_col, player_row)
+        if FOG_OF_WAR and self.fog.update(player_col, player_row):
+            self.dirty_rects.invalidate()
+
+    def update_entities(self):
+        """Tick enemies and attacks by distance from the view: every tick close by, every LOD_FAR_INTERVAL ticks
+        in the outer band, and not at all beyond it (items, chests and barriers have nothing to tick)"""
+        near = self.camera.inflate(LOD_ACTIVE_MARGIN * 2, LOD_ACTIVE_MARGIN * 2)
+        enemies = self.spatial.query_rect(near, COLLIDE_ENEMY)
+        ticks = [1] * len(enemies)
+
+        far = self.camera.inflate(LOD_FAR_MARGIN * 2, LOD_FAR_MARGIN * 2)
+        for enemy in self.spatial.query_rect(far, COLLIDE_ENEMY):
+            # Staggered by sprite so the outer band's work is spread evenly over the interval
+            if not near.colliderect(enemy.rect) and (self.tick_count + hash(enemy)) % LOD_FAR_INTERVAL == 0:
+                enemies.append(enemy)
+                ticks.append(LOD_FAR_INTERVAL)
+        # Decisions are time-sliced across ticks; steering toward the latest targets runs for everyone due
+        self.ai_scheduler.think(enemies, self.tick_count)
+        self.steering.update(enemies, ticks)
+
+        for attack in self.spatial.query_rect(near, COLLIDE_ATTACK):
+            attack.update()
 
     def update_camera(self):
         """Update camera position to follow player"""
@@ -224,26 +340,64 @@ class Game:
             self.camera.x = max(0, min(self.camera.x, len(tilemap[0]) * TILESIZE - SCREEN_WIDTH))
             self.camera.y = max(0, min(self.camera.y, len(tilemap) * TILESIZE - SCREEN_HEIGHT))
 
+    def interpolated_camera(self):
+        """Camera blended between the last two ticks so scrolling stays smooth when rendering outpaces SIM_HZ"""
+        if self.alpha >= 1.0:
+            return self.camera
+        prev_x, prev_y = self.prev_camera
+        return pygame.Rect(round(prev_x + (self.camera.x - prev_x) * self.alpha),
+                           round(prev_y + (self.camera.y - prev_y) * self.alpha),
+                           self.camera.width, self.camera.height)
+
     def draw(self):
         #game loop draw
-        self.screen.fill((BLACK))
+        self.draw_camera = self.interpolated_camera()
+        if DIRTY_RECT_RENDERING:
+            update_rects = self.draw_dirty()
+        else:
+            self.draw_world()
+            self.draw_hud()
+            self.draw_overlays()
+            update_rects = None  # Present the whole screen
 
-        # Draw all sprites with camera offset
-        for sprite in self.all_sprites:
-            offset_x = sprite.rect.x - self.camera.x
-            offset_y = sprite.rect.y - self.camera.y
-            self.screen.blit(sprite.image, (offset_x, offset_y))
+        self.clock.tick(FPS)
+        self.presenter.present(update_rects)
+
+    def draw_world(self, view=None, culled=None):
+        """Draw terrain and sprites, limited to the view rect when one is given (culled as from RenderQueue.cull)"""
+        camera = self.draw_camera
+        self.screen.fill((BLACK), view.move(-camera.x, -camera.y) if view else None)
+
+        # Draw the pre-baked terrain chunks under the camera
+        self.terrain.draw(self.screen, camera, view)
 
-        # Draw HP and Mana bars
-        self.draw_ui()
+        # Draw the sprites the camera can see, one batched blit per layer
+        self.all_sprites.draw(self.screen, camera, view, self.alpha, culled)
+
+        # Darken everything outside the player's line of sight
+        if FOG_OF_WAR:
+            self.fog.draw(self.screen, camera)
+
+    def draw_hud(self):
+        """Draw HP/Mana bars, minimap and the chest prompt, returning the screen rects they cover"""
+        hud_rects = [self.draw_ui()]
+
+        # Draw minimap if toggled
+        if self.show_minimap:
+            hud_rects.append(self.minimap.draw(self.screen))
 
         # Draw inventory if toggled
         if self.show_inventory:
             self.draw_inventory()
 
         # Draw treasure chest interaction prompt
-        self.draw_treasure_prompt()
+        prompt_rect = self.draw_treasure_prompt()
+        if prompt_rect:
+            hud_rects.append(prompt_rect)
+        return hud_rects
 
+    def draw_overlays(self):
+        """Draw the modal menu and question overlays"""
         # Draw in-game menu if active
         if self.show_menu:
             self.draw_menu()
@@ -252,48 +406,50 @@ class Game:
         if self.show_question_ui:
             self.draw_question_ui()
 
-        self.clock.tick(FPS)
-        pygame.display.update()
+    def hud_state(self):
+        """Values the HUD depends on, used to detect when it needs redrawing"""
+        minimap_markers = self.minimap.markers() if self.show_minimap else None
+        return (self.player.current_hp, self.player.current_mana, self.nearby_chest() is not None, minimap_markers)
+
+    def draw_dirty(self):
+        """Redraw only regions that changed since the last frame, returning them for display.update"""
+        tracker = self.dirty_rects
+        camera = self.draw_camera
+        overlay_open = self.show_inventory or self.show_menu or self.show_question_ui
+        if overlay_open or tracker.needs_full_redraw(camera):
+            self.draw_world()
+            tracker.hud_rects = self.draw_hud()
+            self.draw_overlays()
+            tracker.collect(self.all_sprites, camera, self.alpha)
+            tracker.hud_state = self.hud_state()
+            if overlay_open:
+                tracker.invalidate()  # Overlays cover the world, so repaint it all once they close
+            return None
+
+        dirty = tracker.collect(self.all_sprites, camera, self.alpha)
+        hud_state = self.hud_state()
+        hud_dirty = hud_state != tracker.hud_state or any(rect.collidelist(tracker.hud_rects) != -1 for rect in dirty)
+        if hud_dirty:
+            dirty.extend(tracker.hud_rects)
+
+        # Cull sprites once against the area all regions span, then redraw each merged region from that list
+        dirty = merge_rects(dirty)
+        if dirty:
+            culled = self.all_sprites.cull(dirty[0].unionall(dirty[1:]).move(camera.x, camera.y))
+            for rect in dirty:
+                self.screen.set_clip(rect)
+                self.draw_world(rect.move(camera.x, camera.y), culled)
+            self.screen.set_clip(None)
+
+        if hud_dirty:
+            tracker.hud_rects = self.draw_hud()
+            tracker.hud_state = hud_state
+            dirty.extend(tracker.hud_rects)
+        return dirty
 
     def draw_ui(self):
         """Draw HP and Mana bars on screen"""
-        bar_width = 200
-        bar_height = 25
-        ui_x = SCREEN_WIDTH - 220  # Position bars on the right
-        ui_y = 50  # Position bars at the top
-
-        # HP Bar (Red)
-        # Background
-        pygame.draw.rect(self.screen, RED, (ui_x, ui_y, bar_width, bar_height))
-        # Current HP
-        hp_ratio = self.player.current_hp / self.player.max_hp
-        hp_width = int(bar_width * hp_ratio)
-        pygame.draw.rect(self.screen, GREEN, (ui_x, ui_y, hp_width, bar_height))
-        # Border
-        pygame.draw.rect(self.screen, BLACK, (ui_x, ui_y, bar_width, bar_height), 3)
-
-        # HP Text
-        hp_text = self.font.render(f'{self.player.current_hp}/{self.player.max_hp}', False, WHITE)
-        hp_text_rect = hp_text.get_rect(center=(ui_x + bar_width // 2, ui_y + bar_height + 15))
-        self.screen.blit(hp_text, hp_text_rect)
-
-        # Mana Bar (Azure Blue)
-        mana_y = ui_y + bar_height + 50
-        # Background
-        pygame.draw.rect(self.screen, AZURE_BLUE, (ui_x, mana_y, bar_width, bar_height))
-        # Current Mana
-        mana_ratio = self.player.current_mana / self.player.max_mana
-        mana_width = int(bar_width * mana_ratio)
-        pygame.draw.rect(self.screen, BLUE, (ui_x, mana_y, mana_width, bar_height))
-        # Border
-        pygame.draw.rect(self.screen, BLACK, (ui_x, mana_y, bar_width, bar_height), 3)
-
-        # Mana Text
-        mana_text = self.font.render(f'{self.player.current_mana}/{self.player.max_mana}', False, WHITE)
-        mana_text_rect = mana_text.get_rect(center=(ui_x + bar_width // 2, mana_y + bar_height + 15))
-        self.screen.blit(mana_text, mana_text_rect)
-
-        # Potion Counter removed
+        return self.hud_overlay.draw(self.screen)
 
     def draw_potion_counter(self, x, y):
         """Draw potion counter showing available potions"""
@@ -304,194 +460,40 @@ class Game:
                           if hasattr(item, 'name') and 'Mana' in item.name)
 
         # Draw health potion counter (higher)
-        hp_text = self.font.render(f"HP Potions: {hp_potions}", False, RED)
+        hp_text = render_text(self.font, f"HP Potions: {hp_potions}", RED)
         self.screen.blit(hp_text, (x, y - 5))
 
         # Draw mana potion counter (lower)
-        mana_text = self.font.render(f"Mana Potions: {mana_potions}", False, BLUE)
+        mana_text = render_text(self.font, f"Mana Potions: {mana_potions}", BLUE)
         self.screen.blit(mana_text, (x, y + 30))
 
     def draw_inventory(self):
         """Draw inventory UI"""
-        # Draw inventory background
-        inventory_x = (SCREEN_WIDTH - INVENTORY_UI_WIDTH) // 2
-        inventory_y = (SCREEN_HEIGHT - INVENTORY_UI_HEIGHT) // 2
-
-        # Semi-transparent background
-        inventory_surface = pygame.Surface((INVENTORY_UI_WIDTH, INVENTORY_UI_HEIGHT))
-        inventory_surface.fill(INVENTORY_BG_COLOR[:3])
-        inventory_surface.set_alpha(INVENTORY_BG_COLOR[3])
-        self.screen.blit(inventory_surface, (inventory_x, inventory_y))
-
-        # Draw inventory slots
-        for row in range(INVENTORY_ROWS):
-            for col in range(INVENTORY_COLS):
-                slot_x = inventory_x + col * (INVENTORY_SLOT_SIZE + INVENTORY_SLOT_SPACING) + INVENTORY_SLOT_SPACING
-                slot_y = inventory_y + row * (INVENTORY_SLOT_SIZE + INVENTORY_SLOT_SPACING) + INVENTORY_SLOT_SPACING
-
-                # Draw slot background
-                pygame.draw.rect(self.screen, INVENTORY_SLOT_COLOR,
-                               (slot_x, slot_y, INVENTORY_SLOT_SIZE, INVENTORY_SLOT_SIZE))
-
-                # Draw slot border
-                pygame.draw.rect(self.screen, INVENTORY_BORDER_COLOR,
-                               (slot_x, slot_y, INVENTORY_SLOT_SIZE, INVENTORY_SLOT_SIZE), 2)
-
-                # Get item index
-                item_index = row * INVENTORY_COLS + col
-
-                # Draw item if exists
-                if item_index < len(self.inventory.items):
-                    item = self.inventory.items[item_index]
-
-                    # Draw item icon if available
-                    if hasattr(item, 'icon') and item.icon:
-                        try:
-                            # Load and scale the item icon
-                            item_image = pygame.image.load(item.icon).convert_alpha()
-                            item_image = pygame.transform.scale(item_image, (INVENTORY_SLOT_SIZE - 4, INVENTORY_SLOT_SIZE - 4))
-                            self.screen.blit(item_image, (slot_x + 2, slot_y + 2))
-                        except (pygame.error, FileNotFoundError):
-                            # Fallback to colored rectangle if image loading fails
-                            item_color = GREEN if item.item_type == "potion" else \
-                                        RED if item.item_type == "weapon" else \
-                                        (255, 215, 0) if item.item_type == "collectible" else WHITE
-                            pygame.draw.rect(self.screen, item_color,
-                                           (slot_x + 2, slot_y + 2, INVENTORY_SLOT_SIZE - 4, INVENTORY_SLOT_SIZE - 4))
-                    else:
-                        # Fallback to colored rectangle if no icon
-                        item_color = GREEN if item.item_type == "potion" else \
-                                    RED if item.item_type == "weapon" else \
-                                    (255, 215, 0) if item.item_type == "collectible" else WHITE
-                        pygame.draw.rect(self.screen, item_color,
-                                       (slot_x + 2, slot_y + 2, INVENTORY_SLOT_SIZE - 4, INVENTORY_SLOT_SIZE - 4))
-
-                    # Draw item count if > 1
-                    if item.quantity > 1:
-                        count_text = self.font.render(str(item.quantity), False, INVENTORY_ITEM_COUNT_COLOR)
-                        count_rect = count_text.get_rect(bottomright=(slot_x + INVENTORY_SLOT_SIZE - 2, slot_y + INVENTORY_SLOT_SIZE - 2))
-                        self.screen.blit(count_text, count_rect)
-
-        # Draw inventory title
-        title_text = self.font.render("Inventory (Press I to close)", False, INVENTORY_TEXT_COLOR)
-        title_rect = title_text.get_rect(centerx=SCREEN_WIDTH // 2, top=inventory_y - 40)
-        self.screen.blit(title_text, title_rect)
-
-        # Draw inventory info
-        info_text = self.font.render(f"Items: {len(self.inventory.items)}/{self.inventory.max_slots}", False, INVENTORY_TEXT_COLOR)
-        info_rect = info_text.get_rect(centerx=SCREEN_WIDTH // 2, top=inventory_y + INVENTORY_UI_HEIGHT + 10)
-        self.screen.blit(info_text, info_rect)
+        return self.inventory_overlay.draw(self.screen)
+
+    def nearby_chest(self):
+        """Return the unopened chest the player is in range of, kept current by its trigger callbacks"""
+        return self.prompt_chest
 
     def draw_treasure_prompt(self):
         """Draw prompt to interact with nearby treasure chests"""
-        if self.player:
-            # Check if player is near any treasure chest
-            for chest in self.treasure_chests:
-                if not chest.is_open:
-                    player_distance = math.sqrt(
-                        (self.player.rect.centerx - chest.rect.centerx)**2 +
-                        (self.player.rect.centery - chest.rect.centery)**2
-                    )
-
-                    if player_distance <= chest.interaction_range:
-                        # Draw interaction prompt
-                        prompt_text = self.font.render("Press E to open treasure chest", False, WHITE)
-                        prompt_rect = prompt_text.get_rect(centerx=SCREEN_WIDTH // 2, top=50)
-                        self.screen.blit(prompt_text, prompt_rect)
-                        break
+        if self.nearby_chest():
+            # Draw interaction prompt
+            prompt_text = render_text(self.font, "Press E to open treasure chest", WHITE)
+            prompt_rect = prompt_text.get_rect(centerx=SCREEN_WIDTH // 2, top=50)
+            self.screen.blit(prompt_text, prompt_rect)
+            return prompt_rect
+        return None
 
     def draw_menu(self):
         """Draw the in-game menu overlay"""
-        # Semi-transparent background
-        menu_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        menu_surface.fill(MENU_BG_COLOR[:3])
-        menu_surface.set_alpha(MENU_BG_COLOR[3])
-        self.screen.blit(menu_surface, (0, 0))
-
-        # Menu title
-        title_font = pygame.font.Font('darkbyte.ttf', MENU_TITLE_FONT_SIZE)
-        title_text = title_font.render("Game Menu", False, MENU_TEXT_COLOR)
-        title_rect = title_text.get_rect(centerx=SCREEN_WIDTH // 2, top=100)
-        self.screen.blit(title_text, title_rect)
-
-        # Menu buttons
-        button_font = pygame.font.Font('darkbyte.ttf', MENU_BUTTON_FONT_SIZE)
-        buttons = [
-            ("Save Game", SCREEN_HEIGHT // 2 - 100),
-            ("Music: " + ("Off" if self.music_paused else "On"), SCREEN_HEIGHT // 2 - 100 + MENU_BUTTON_HEIGHT + MENU_BUTTON_SPACING),
-            ("Return to Game", SCREEN_HEIGHT // 2 - 100 + 2 * (MENU_BUTTON_HEIGHT + MENU_BUTTON_SPACING)),
-            ("Quit Game", SCREEN_HEIGHT // 2 - 100 + 3 * (MENU_BUTTON_HEIGHT + MENU_BUTTON_SPACING))
-        ]
-
-        self.menu_buttons = []
-        for i, (text, y) in enumerate(buttons):
-            button_rect = pygame.Rect(
-                (SCREEN_WIDTH - MENU_BUTTON_WIDTH) // 2,
-                y,
-                MENU_BUTTON_WIDTH,
-                MENU_BUTTON_HEIGHT
-            )
-            self.menu_buttons.append(button_rect)
-
-            # Check if mouse is hovering over button or if it's selected via keyboard
-            mouse_pos = pygame.mouse.get_pos()
-            is_hovered = button_rect.collidepoint(mouse_pos)
-            is_selected = (i == self.selected_button)
-            button_color = MENU_BUTTON_HOVER_COLOR if (is_hovered or is_selected) else MENU_BUTTON_COLOR
-
-            # Draw button
-            pygame.draw.rect(self.screen, button_color, button_rect)
-            pygame.draw.rect(self.screen, WHITE, button_rect, 2)
-
-            # Draw button text
-            button_text = button_font.render(text, False, MENU_TEXT_COLOR)
-            text_rect = button_text.get_rect(center=button_rect.center)
-            self.screen.blit(button_text, text_rect)
-
-        # Instructions
-        instr_text = self.font.render("Use Arrow/WASD keys to navigate, Enter to select, ESC to close", False, MENU_TEXT_COLOR)
-        instr_rect = instr_text.get_rect(centerx=SCREEN_WIDTH // 2, top=SCREEN_HEIGHT - 100)
-        self.screen.blit(instr_text, instr_rect)
+        return self.menu_overlay.draw(self.screen)
 
     def draw_question_ui(self):
         """Draw the question UI overlay"""
         if not self.question_barrier:
-            return
-
-        # Semi-transparent background
-        ui_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        ui_surface.fill((0, 0, 0))
-        ui_surface.set_alpha(150)
-        self.screen.blit(ui_surface, (0, 0))
-
-        # Question box
-        box_width = 600
-        box_height = 400
-        box_x = (SCREEN_WIDTH - box_width) // 2
-        box_y = (SCREEN_HEIGHT - box_height) // 2
-
-        # Draw box background
-        pygame.draw.rect(self.screen, (50, 50, 50), (box_x, box_y, box_width, box_height))
-        pygame.draw.rect(self.screen, WHITE, (box_x, box_y, box_width, box_height), 3)
-
-        # Question text
-        question_font = pygame.font.Font('darkbyte.ttf', 24)
-        question_text = question_font.render(self.question_barrier.question, False, WHITE)
-        question_rect = question_text.get_rect(centerx=SCREEN_WIDTH // 2, top=box_y + 30)
-        self.screen.blit(question_text, question_rect)
-
-        # Options
-        option_font = pygame.font.Font('darkbyte.ttf', 20)
-        for i, option in enumerate(self.question_barrier.options):
-            color = YELLOW if i == self.selected_option else WHITE
-            option_text = option_font.render(f"{chr(65 + i)}. {option}", False, color)
-            option_rect = option_text.get_rect(centerx=SCREEN_WIDTH // 2, top=box_y + 100 + i * 40)
-            self.screen.blit(option_text, option_rect)
-
-        # Instructions
-        instr_text = self.font.render("Use Up/Down to navigate, Enter to select", False, WHITE)
-        instr_rect = instr_text.get_rect(centerx=SCREEN_WIDTH // 2, top=box_y + box_height - 50)
-        self.screen.blit(instr_text, instr_rect)
+            return None
+        return self.question_overlay.draw(self.screen)
 
     def save_game(self, slot=1):
         """Save the current game state to a file"""
@@ -519,37 +521,62 @@ class Game:
                 save_data = pickle.load(f)
             self.player.current_hp = save_data['player_hp']
             self.player.current_mana = save_data['player_mana']
-            self.player.rect.x = save_data['player_x']
-            self.player.rect.y = save_data['player_y']
+            self.player.rect.x = self.player.x = save_data['player_x']
+            self.player.rect.y = self.player.y = save_data['player_y']
+            self.player.prev_pos = self.player.rect.topleft  # Don't interpolate across the jump
             self.inventory.items = save_data['inventory']
-            self.music_paused = save_data['music_paused']
-            if self.music_paused:
-                pygame.mixer.music.pause()
-            else:
-                pygame.mixer.music.unpause()
+            self.set_music_paused(save_data['music_paused'])
             print("Game loaded successfully!")
         except Exception as e:
             print(f"Failed to load game: {e}")
 
+    def mouse_pos(self):
+        """Mouse position in screen (logical render) coordinates"""
+        return self.presenter.to_screen(pygame.mouse.get_pos())
+
+    def start_music(self, music):
+        """Initialise the mixer now that there is something to play, and loop the background music"""
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"Audio unavailable: {e}")
+            return
+        pygame.mixer.music.load(music, 'mp3')
+        pygame.mixer.music.play(-1)
+
+    def set_music_paused(self, paused):
+        """Pause or resume the background music, if audio is running"""
+        self.music_paused = paused
+        if pygame.mixer.get_init():
+            if paused:
+                pygame.mixer.music.pause()
+            else:
+                pygame.mixer.music.unpause()
+
     def toggle_music(self):
         """Toggle background music on/off"""
-        if self.music_paused:
-            pygame.mixer.music.unpause()
-            self.music_paused = False
-        else:
-            pygame.mixer.music.pause()
-            self.music_paused = True
+        self.set_music_paused(not self.music_paused)
 
     def main(self):
-        #gameloop
+        #gameloop: render every frame, simulate in fixed SIM_DT ticks for however much time has passed
+        accumulator = 0.0
+        previous = time.perf_counter()
         while self.playing:
+            now = time.perf_counter()
+            frame_time = min(now - previous, MAX_FRAME_TIME)
+            previous = now
+
             self.events()
             if not self.show_menu:
-                self.update()
+                accumulator += frame_time
+                while accumulator >= SIM_DT and self.playing:
+                    self.update()
+                    accumulator -= SIM_DT
+                self.alpha = accumulator / SIM_DT
             self.draw()
 
     def game_over(self):
-        text = self.font.render('Game Over', False, WHITE)
+        text = render_text(self.font, 'Game Over', WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2))
 
         restart_button = Button(10, SCREEN_HEIGHT - 60, 120, 50, WHITE, BLACK, 'Restart', 20)
@@ -562,7 +589,7 @@ class Game:
                 if event.type == pygame.QUIT:
                     self.running = False
 
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = self.mouse_pos()
             mouse_pressed = pygame.mouse.get_pressed()
 
             if restart_button.is_pressed(mouse_pos, mouse_pressed):
@@ -573,7 +600,7 @@ class Game:
             self.screen.blit(text, text_rect)
             self.screen.blit(restart_button.image, restart_button.rect)
             self.clock.tick(FPS)
-            pygame.display.update()
+            self.presenter.present()
 
     def main_menu(self):
         menu_running = True
@@ -584,6 +611,7 @@ class Game:
 
         # Removed main menu title
 
+        self.intro_background.start()
         while menu_running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -629,15 +657,8 @@ class Game:
                             self.running = False
 
             # Update GIF animation
-            if self.intro_background_frames:
-                self.intro_background_timer += self.clock.get_time()
-                current_duration = self.intro_background_durations[self.intro_background_frame] if self.intro_background_durations else 100
-                if self.intro_background_timer >= current_duration:
-                    self.intro_background_timer = 0
-                    self.intro_background_frame = (self.intro_background_frame + 1) % len(self.intro_background_frames)
-                    self.intro_background = self.intro_background_frames[self.intro_background_frame]
-
-            self.screen.blit(self.intro_background.convert_alpha(), (0,0))
+            self.intro_background.update(self.clock.get_time())
+            self.intro_background.draw(self.screen)
 
             if self.show_continue_menu:
                 self.draw_continue_menu()
@@ -645,24 +666,28 @@ class Game:
                 self.draw_main_menu_buttons(buttons)
 
             self.clock.tick(FPS)
-            pygame.display.update()
+            self.presenter.present()
+
+        # Free the decoded frames once the menu closes
+        self.intro_background.close()
 
     def draw_main_menu_buttons(self, buttons):
-        button_font = pygame.font.Font('darkbyte.ttf', 40)
+        button_font = get_font('darkbyte.ttf', 40)
         for i, button_text in enumerate(buttons):
             color = WHITE if i == self.selected_button else GRAY
-            text = button_font.render(button_text, False, color)
+            text = render_text(button_font, button_text, color)
             extra_space = 60 if i == 3 else 30 if i == 2 else 20 if i == 1 else 0
-            rect = text.get_rect(centerx=SCREEN_WIDTH // 2, centery=600 + i * 90 + extra_space)
+            # Buttons start at y=600 on 1080p and taller screens, higher up on smaller render sizes
+            rect = text.get_rect(centerx=SCREEN_WIDTH // 2, centery=min(600, SCREEN_HEIGHT - 480) + i * 90 + extra_space)
             self.screen.blit(text, rect)
 
     def draw_continue_menu(self):
-        continue_title_font = pygame.font.Font('darkbyte.ttf', 40)
-        title = continue_title_font.render('Select Save File', False, WHITE)
+        continue_title_font = get_font('darkbyte.ttf', 40)
+        title = render_text(continue_title_font, 'Select Save File', WHITE)
         title_rect = title.get_rect(centerx=SCREEN_WIDTH // 2, y=150)
         self.screen.blit(title, title_rect)
 
-        button_font = pygame.font.Font('darkbyte.ttf', 40)
+        button_font = get_font('darkbyte.ttf', 40)
         for i in range(3):
             save_file = f'save{i+1}.pkl'
             if os.path.exists(save_file):
@@ -673,27 +698,28 @@ class Game:
             else:
                 text = f'Save {i+1}: Empty'
             color = WHITE if i == self.continue_selected else GRAY
-            text_surf = button_font.render(text, False, color)
+            text_surf = render_text(button_font, text, color)
             rect = text_surf.get_rect(centerx=SCREEN_WIDTH // 2, centery=200 + i * 60)
             self.screen.blit(text_surf, rect)
 
         # Back option
         color = WHITE if 3 == self.continue_selected else GRAY
-        back_text = button_font.render('Back', False, color)
+        back_text = render_text(button_font, 'Back', color)
         back_rect = back_text.get_rect(centerx=SCREEN_WIDTH // 2, centery=200 + 3 * 60)
         self.screen.blit(back_text, back_rect)
 
-g = Game()
-g.main_menu()
-g.new()
-while g.running:
-    g.main()
-    if g.return_to_menu:
-        g.return_to_menu = False
-        g.main_menu()
-        g.new()
-    else:
-        g.game_over()
-
-pygame.quit()
-sys.exit()
\ No newline at end of file
+if __name__ == '__main__':
+    g = Game()
+    g.main_menu()
+    g.new()
+    while g.running:
+        g.main()
+        if g.return_to_menu:
+            g.return_to_menu = False
+            g.main_menu()
+            g.new()
+        else:
+            g.game_over()
+
+    pygame.quit()
+    sys.exit()
\ No newline at end of file
@@ -0,0 +1,55 @@
+import pygame
+from config import *
+
+class Minimap:
+    """Level overview: the tile grid is rendered once and only the markers are drawn each frame"""
+    def __init__(self, game, terrain, tile_size=MINIMAP_TILE_SIZE):
+        self.game = game
+        self.terrain = terrain
+        self.tile_size = tile_size
+        self.pos = (0, 0)
+        self.base = None
+        self.built_version = None  # terrain.version the cached grid was drawn from
+
+    def build(self):
+        """Render the tile grid into the cached base surface"""
+        size = self.tile_size
+        surface = pygame.Surface((self.terrain.cols * size + 2, self.terrain.rows * size + 2)).convert()
+        surface.fill(MINIMAP_BORDER_COLOR)
+        surface.fill(MINIMAP_FLOOR_COLOR, (1, 1, self.terrain.cols * size, self.terrain.rows * size))
+        for row, tiles in enumerate(self.terrain.tiles):
+            for col, char in enumerate(tiles):
+                if char in SOLID_TILES:
+                    surface.fill(MINIMAP_WALL_COLOR, (1 + col * size, 1 + row * size, size, size))
+        self.base = surface
+        self.built_version = self.terrain.version
+
+    def markers(self):
+        """(color, col, row) for the player, enemies near the player and unopened chests"""
+        player = self.game.player
+        player_col = player.rect.centerx // TILESIZE
+        player_row = player.rect.centery // TILESIZE
+        markers = [(MINIMAP_CHEST_COLOR, chest.rect.centerx // TILESIZE, chest.rect.centery // TILESIZE)
+                   for chest in self.game.treasure_chests if not chest.is_open]
+        area = pygame.Rect((player_col - MINIMAP_ENEMY_RADIUS) * TILESIZE, (player_row - MINIMAP_ENEMY_RADIUS) * TILESIZE,
+                           (MINIMAP_ENEMY_RADIUS * 2 + 1) * TILESIZE, (MINIMAP_ENEMY_RADIUS * 2 + 1) * TILESIZE)
+        for enemy in self.game.spatial.query_rect(area, COLLIDE_ENEMY):
+            col = enemy.rect.centerx // TILESIZE
+            row = enemy.rect.centery // TILESIZE
+            if abs(col - player_col) <= MINIMAP_ENEMY_RADIUS and abs(row - player_row) <= MINIMAP_ENEMY_RADIUS:
+                markers.append((MINIMAP_ENEMY_COLOR, col, row))
+        markers.append((MINIMAP_PLAYER_COLOR, player_col, player_row))
+        return markers
+
+    def draw(self, screen):
+        """Blit the cached grid, rebuilding it only if tiles changed, then fill in the markers"""
+        if self.base is None or self.built_version != self.terrain.version:
+            self.build()
+        self.pos = (MINIMAP_MARGIN, screen.get_height() - self.base.get_height() - MINIMAP_MARGIN)  # Bottom left corner
+        screen.blit(self.base, self.pos)
+        size = self.tile_size
+        left = self.pos[0] + 1
+        top = self.pos[1] + 1
+        for color, col, row in self.markers():
+            screen.fill(color, (left + col * size, top + row * size, size, size))
+        return self.base.get_rect(topleft=self.pos)
@@ -0,0 +1,310 @@
+import heapq
+from collections import OrderedDict, deque
+from config import *
+
+UNREACHED = -1
+
+# 8-way neighbour offsets; diagonals are only taken when both adjacent orthogonal tiles are open
+NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+class FlowField:
+    """Breadth-first step counts out from the player's tile; each enemy reads its next tile in O(1)"""
+    def __init__(self, grid, radius=FLOW_FIELD_RADIUS):
+        self.grid = grid
+        self.radius = radius
+        size = grid.cols * grid.rows
+        self.distance = [UNREACHED] * size  # Steps to the origin per tile, row-major
+        self.next_cell = [UNREACHED] * size  # Index of the neighbour one step closer to the origin
+        self.reached = []  # Cells written by the last search, so clearing costs only what was searched
+        self.origin = None
+        self.built_version = None
+
+    def update(self, col, row):
+        """Re-run the search if the player changed tile or walls changed; return True if it did"""
+        if (col, row) == self.origin and self.built_version == self.grid.version:
+            return False
+        self.origin = (col, row)
+        self.built_version = self.grid.version
+
+        for index in self.reached:
+            self.distance[index] = UNREACHED
+            self.next_cell[index] = UNREACHED
+        self.reached = []
+        if self.grid.is_solid(col, row):
+            return True
+
+        cols = self.grid.cols
+        start = row * cols + col
+        self.distance[start] = 0
+        self.next_cell[start] = start
+        self.reached.append(start)
+        frontier = deque([(col, row)])
+        while frontier:
+            c, r = frontier.popleft()
+            index = r * cols + c
+            steps = self.distance[index] + 1
+            if steps > self.radius:
+                continue
+            for dx, dy in NEIGHBOURS:
+                nc = c + dx
+                nr = r + dy
+                if self.grid.is_solid(nc, nr):
+                    continue
+                if dx and dy and (self.grid.is_solid(c + dx, r) or self.grid.is_solid(c, r + dy)):
+                    continue
+                neighbour = nr * cols + nc
+                if self.distance[neighbour] == UNREACHED:
+                    self.distance[neighbour] = steps
+                    self.next_cell[neighbour] = index
+                    self.reached.append(neighbour)
+                    frontier.append((nc, nr))
+        return True
+
+    def steps_at(self, col, row):
+        """Path length from a tile to the origin, or UNREACHED"""
+        if 0 <= col < self.grid.cols and 0 <= row < self.grid.rows:
+            return self.distance[row * self.grid.cols + col]
+        return UNREACHED
+
+    def next_tile(self, col, row, max_steps):
+        """The tile one step closer to the origin, or None if this tile is unreached or further than max_steps"""
+        steps = self.steps_at(col, row)
+        if steps == UNREACHED or steps > max_steps:
+            return None
+        index = self.next_cell[row * self.grid.cols + col]
+        return index % self.grid.cols, index // self.grid.cols
+
+def open_neighbours(grid, col, row):
+    """Walkable 8-way neighbours of a tile, using the same corner rule as the flow field"""
+    for dx, dy in NEIGHBOURS:
+        nc = col + dx
+        nr = row + dy
+        if grid.is_solid(nc, nr):
+            continue
+        if dx and dy and (grid.is_solid(col + dx, row) or grid.is_solid(col, row + dy)):
+            continue
+        yield nc, nr
+
+def local_search(grid, start, bounds):
+    """Breadth-first search from start that stays inside bounds (first_col, first_row, last_col, last_row);
+    returns {tile: (steps, previous tile)}"""
+    first_col, first_row, last_col, last_row = bounds
+    visited = {start: (0, None)}
+    frontier = deque([start])
+    while frontier:
+        tile = frontier.popleft()
+        steps = visited[tile][0] + 1
+        for neighbour in open_neighbours(grid, *tile):
+            if neighbour not in visited and first_col <= neighbour[0] <= last_col and first_row <= neighbour[1] <= last_row:
+                visited[neighbour] = (steps, tile)
+                frontier.append(neighbour)
+    return visited
+
+def trace_path(visited, goal):
+    """Tiles from just after the search start to goal"""
+    path = []
+    tile = goal
+    while visited[tile][1] is not None:
+        path.append(tile)
+        tile = visited[tile][1]
+    path.reverse()
+    return path
+
+class HierarchicalPathfinder:
+    """HPA*: the map is cut into square clusters joined by entrance tiles on their shared borders. Long routes are
+    planned over entrances (cached per cluster pair) and only the leg the enemy is on is refined to tiles."""
+    GOAL = (-1, -1)  # Virtual off-map node joined to the goal cluster's entrances during a search
+
+    def __init__(self, grid, cluster_tiles=HPA_CLUSTER_TILES, cache_size=HPA_PATH_CACHE_SIZE):
+        self.grid = grid
+        self.cluster_tiles = cluster_tiles
+        self.cluster_cols = (grid.cols + cluster_tiles - 1) // cluster_tiles
+        self.cluster_rows = (grid.rows + cluster_tiles - 1) // cluster_tiles
+        self.cache_size = cache_size
+
+        self.borders = {}  # (cluster, neighbour cluster right/below) -> [(tile in cluster, tile in neighbour)]
+        self.links = {}  # Entrance tile -> entrance tiles one step away across a border
+        self.nodes = {}  # Cluster -> entrance tiles inside it
+        self.intra = {}  # Cluster -> {entrance: {other entrance: steps inside the cluster}}
+        self.path_cache = OrderedDict()  # (start cluster, goal cluster) -> (entrance route, clusters it crosses)
+        self.seen_changes = len(grid.changes)
+        self.goal_reach = None  # (goal, grid version, local search around the goal)
+
+        for cluster_y in range(self.cluster_rows):
+            for cluster_x in range(self.cluster_cols):
+                self.build_borders((cluster_x, cluster_y))
+        for cluster in self.clusters():
+            self.build_cluster(cluster)
+
+    def clusters(self):
+        for cluster_y in range(self.cluster_rows):
+            for cluster_x in range(self.cluster_cols):
+                yield cluster_x, cluster_y
+
+    def cluster_of(self, tile):
+        return tile[0] // self.cluster_tiles, tile[1] // self.cluster_tiles
+
+    def bounds(self, *clusters):
+        """Tile bounds covering one or two (adjacent) clusters"""
+        size = self.cluster_tiles
+        first_col = min(cluster[0] for cluster in clusters) * size
+        first_row = min(cluster[1] for cluster in clusters) * size
+        last_col = min((max(cluster[0] for cluster in clusters) + 1) * size, self.grid.cols) - 1
+        last_row = min((max(cluster[1] for cluster in clusters) + 1) * size, self.grid.rows) - 1
+        return first_col, first_row, last_col, last_row
+
+    def build_borders(self, cluster):
+        """Find entrances on the right and bottom borders of a cluster: one per run of tiles open on both sides"""
+        cluster_x, cluster_y = cluster
+        first_col, first_row, last_col, last_row = self.bounds(cluster)
+        if cluster_x + 1 < self.cluster_cols:
+            pairs = [((last_col, row), (last_col + 1, row)) for row in range(first_row, last_row + 1)]
+            self.set_border(cluster, (cluster_x + 1, cluster_y), pairs)
+        if cluster_y + 1 < self.cluster_rows:
+            pairs = [((col, last_row), (col, last_row + 1)) for col in range(first_col, last_col + 1)]
+            self.set_border(cluster, (cluster_x, cluster_y + 1), pairs)
+
+    def set_border(self, cluster, neighbour, pairs):
+        """Replace the entrances between two clusters with the middle of each open run along their border"""
+        for inside, outside in self.borders.pop((cluster, neighbour), ()):
+            self.links[inside].discard(outside)
+            self.links[outside].discard(inside)
+        entrances = []
+        run = []
+        for inside, outside in pairs:
+            if not self.grid.is_solid(*inside) and not self.grid.is_solid(*outside):
+                run.append((inside, outside))
+            elif run:
+                entrances.append(run[len(run) // 2])
+                run = []
+        if run:
+            entrances.append(run[len(run) // 2])
+        self.borders[(cluster, neighbour)] = entrances
+        for inside, outside in entrances:
+            self.links.setdefault(inside, set()).add(outside)
+            self.links.setdefault(outside, set()).add(inside)
+
+    def build_cluster(self, cluster):
+        """Collect a cluster's entrances and the step counts between them inside the cluster"""
+        cluster_x, cluster_y = cluster
+        nodes = set()
+        for key in (((cluster_x - 1, cluster_y), cluster), ((cluster_x, cluster_y - 1), cluster)):
+            nodes.update(outside for inside, outside in self.borders.get(key, ()))
+        for key in ((cluster, (cluster_x + 1, cluster_y)), (cluster, (cluster_x, cluster_y + 1))):
+            nodes.update(inside for inside, outside in self.borders.get(key, ()))
+        self.nodes[cluster] = nodes
+
+        bounds = self.bounds(cluster)
+        edges = {}
+        for node in nodes:
+            visited = local_search(self.grid, node, bounds)
+            edges[node] = {other: visited[other][0] for other in nodes if other != node and other in visited}
+        self.intra[cluster] = edges
+
+    def sync(self):
+        """Rebuild only the clusters around tiles that opened or closed since the last query"""
+        changes = self.grid.changes[self.seen_changes:]
+        if not changes:
+            return
+        self.seen_changes = len(self.grid.changes)
+        affected = set()
+        for tile in changes:
+            cluster_x, cluster_y = self.cluster_of(tile)
+            for cluster in ((cluster_x, cluster_y), (cluster_x - 1, cluster_y), (cluster_x, cluster_y - 1)):
+                if cluster[0] >= 0 and cluster[1] >= 0:
+                    self.build_borders(cluster)
+            affected.update(((cluster_x, cluster_y), (cluster_x - 1, cluster_y), (cluster_x + 1, cluster_y),
+                             (cluster_x, cluster_y - 1), (cluster_x, cluster_y + 1)))
+        affected = {cluster for cluster in affected if cluster in self.intra}
+        for cluster in affected:
+            self.build_cluster(cluster)
+        for key, (route, crossed) in list(self.path_cache.items()):
+            if crossed & affected or key[0] in affected or key[1] in affected:
+                del self.path_cache[key]
+
+    def heuristic(self, tile, goal):
+        return max(abs(tile[0] - goal[0]), abs(tile[1] - goal[1]))
+
+    def abstract_search(self, start_costs, goal_costs, goal):
+        """A* over entrances from the start's reachable entrances to the virtual goal node"""
+        best = {}
+        came_from = {}
+        open_heap = []
+        for node, cost in start_costs.items():
+            best[node] = cost
+            came_from[node] = None
+            heapq.heappush(open_heap, (cost + self.heuristic(node, goal), cost, node))
+        while open_heap:
+            f, cost, node = heapq.heappop(open_heap)
+            if node == self.GOAL:
+                route = []
+                node = came_from[self.GOAL]
+                while node is not None:
+                    route.append(node)
+                    node = came_from[node]
+                route.reverse()
+                return route
+            if cost > best.get(node, cost):
+                continue
+            successors = list(self.intra[self.cluster_of(node)].get(node, {}).items())
+            successors.extend((other, 1) for other in self.links.get(node, ()))
+            if node in goal_costs:
+                successors.append((self.GOAL, goal_costs[node]))
+            for other, step in successors:
+                new_cost = cost + step
+                if new_cost < best.get(other, new_cost + 1):
+                    best[other] = new_cost
+                    came_from[other] = node
+                    estimate = 0 if other == self.GOAL else self.heuristic(other, goal)
+                    heapq.heappush(open_heap, (new_cost + estimate, new_cost, other))
+        return None
+
+    def goal_search(self, goal):
+        """Local search around the goal, reused by every hunter until the goal or the walls change"""
+        if self.goal_reach is None or self.goal_reach[0] != goal or self.goal_reach[1] != self.grid.version:
+            self.goal_reach = (goal, self.grid.version, local_search(self.grid, goal, self.bounds(self.cluster_of(goal))))
+        return self.goal_reach[2]
+
+    def find_route(self, start, goal):
+        """Waypoints from start to goal (entrance tiles, then the goal itself) and the start's local search;
+        the route is None if unreachable"""
+        self.sync()
+        start_cluster = self.cluster_of(start)
+        goal_cluster = self.cluster_of(goal)
+        start_reach = local_search(self.grid, start, self.bounds(start_cluster))
+        if goal in start_reach:
+            return [goal], start_reach
+
+        goal_reach = self.goal_search(goal)
+        key = (start_cluster, goal_cluster)
+        cached = self.path_cache.get(key)
+        if cached and cached[0][0] in start_reach and cached[0][-1] in goal_reach:
+            self.path_cache.move_to_end(key)
+            return cached[0] + [goal], start_reach
+
+        start_costs = {node: start_reach[node][0] for node in self.nodes[start_cluster] if node in start_reach}
+        goal_costs = {node: goal_reach[node][0] for node in self.nodes[goal_cluster] if node in goal_reach}
+        route = self.abstract_search(start_costs, goal_costs, goal)
+        if route is None:
+            return None, start_reach
+        self.path_cache[key] = (route, {self.cluster_of(node) for node in route})
+        if len(self.path_cache) > self.cache_size:
+            self.path_cache.popitem(last=False)  # Evict the least recently used route
+        return route + [goal], start_reach
+
+    def next_tile(self, start, goal):
+        """First tile to step onto on the way from start to goal, or None if there is no route"""
+        if start == goal:
+            return None
+        route, start_reach = self.find_route(start, goal)
+        if not route:
+            return None
+        waypoint = route[0] if route[0] != start else (route[1] if len(route) > 1 else None)
+        if waypoint is None:
+            return None
+        # The first waypoint is in the start cluster, or one step across its border when standing on an entrance
+        if waypoint in start_reach:
+            return trace_path(start_reach, waypoint)[0]
+        if waypoint in self.links.get(start, ()):
+            return waypoint
+        return None
@@ -0,0 +1,175 @@
+import pygame
+from config import *
+
+# pygame-ce provides a faster blits variant that skips building the result list
+FAST_BLITS = hasattr(pygame.Surface, 'fblits')
+
+def merge_rects(rects):
+    """Union overlapping rects until none overlap, so each screen area is redrawn once"""
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+class RenderQueue(pygame.sprite.AbstractGroup):
+    """Sprite group that keeps per-layer draw lists and only draws what the camera sees"""
+    def __init__(self, *sprites, y_sort_layers=()):
+        self.layers = {}  # Layer -> dict used as an insertion-ordered set of sprites
+        self.layer_order = []
+        self.sprite_layers = {}
+        self.y_sort_layers = set(y_sort_layers)
+        super().__init__()
+        self.add(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        """Register sprite in its layer list (O(1), no sorted insertion)"""
+        super().add_internal(sprite)
+        if layer is None:
+            layer = getattr(sprite, '_layer', 0)
+        if layer not in self.layers:
+            self.layers[layer] = {}
+            self.layer_order = sorted(self.layers)
+        self.layers[layer][sprite] = None
+        self.sprite_layers[sprite] = layer
+
+    def remove_internal(self, sprite):
+        """Drop sprite from its layer list"""
+        super().remove_internal(sprite)
+        layer = self.sprite_layers.pop(sprite, None)
+        if layer is not None:
+            self.layers[layer].pop(sprite, None)
+
+    def visible(self, layer, view):
+        """Return the sprites of a layer whose rect overlaps the view rect"""
+        sprites = [sprite for sprite in self.layers[layer] if view.colliderect(sprite.rect)]
+        if layer in self.y_sort_layers:
+            sprites.sort(key=lambda sprite: sprite.rect.bottom)
+        return sprites
+
+    def cull(self, view):
+        """Visible sprites of every layer at once, so several regions inside view can be drawn without rescanning"""
+        return {layer: self.visible(layer, view) for layer in self.layer_order}
+
+    def screen_pos(self, sprite, camera, alpha=1.0):
+        """Where to blit a sprite, blended from its previous tick position when it has one"""
+        x, y = sprite.rect.topleft
+        prev = getattr(sprite, 'prev_pos', None)
+        if prev and alpha < 1.0:
+            x = round(prev[0] + (x - prev[0]) * alpha)
+            y = round(prev[1] + (y - prev[1]) * alpha)
+        return x - camera.x, y - camera.y
+
+    def draw(self, surface, camera, view=None, alpha=1.0, culled=None):
+        """Draw visible sprites with one batched blit call per layer, interpolated alpha of the way into the tick;
+        culled (from cull) narrows the candidates to sprites already known to lie near the view"""
+        view = view or camera
+        offset_x, offset_y = camera.x, camera.y
+        for layer in self.layer_order:
+            if culled is None:
+                sprites = self.visible(layer, view)
+            else:
+                sprites = [sprite for sprite in culled.get(layer, ()) if view.colliderect(sprite.rect)]
+            if alpha < 1.0:
+                batch = [(sprite.image, self.screen_pos(sprite, camera, alpha)) for sprite in sprites]
+            else:
+                batch = [(sprite.image, (sprite.rect.x - offset_x, sprite.rect.y - offset_y)) for sprite in sprites]
+            if not batch:
+                continue
+            if FAST_BLITS:
+                surface.fblits(batch)
+            else:
+                surface.blits(batch, False)
+
+class DirtyRectTracker:
+    """Remembers what was on screen last frame so only changed regions get redrawn"""
+    def __init__(self):
+        self.sprite_rects = {}  # Sprite -> (screen rect, image) as last drawn
+        self.camera_pos = None
+        self.hud_state = None
+        self.hud_rects = []
+        self.force_full = True
+
+    def invalidate(self):
+        """Request a full redraw on the next frame"""
+        self.force_full = True
+
+    def needs_full_redraw(self, camera):
+        """Full redraw when requested or when the camera has scrolled"""
+        return self.force_full or camera.topleft != self.camera_pos
+
+    def collect(self, queue, camera, alpha=1.0):
+        """Return screen rects of sprites that moved, changed image, appeared or vanished"""
+        current = {}
+        dirty = []
+        for layer in queue.layer_order:
+            for sprite in queue.visible(layer, camera):
+                rect = sprite.image.get_rect(topleft=queue.screen_pos(sprite, camera, alpha))
+                current[sprite] = (rect, sprite.image)
+                previous = self.sprite_rects.get(sprite)
+                if previous is None:
+                    dirty.append(rect)
+                elif previous[0] != rect or previous[1] is not sprite.image:
+                    dirty.append(rect)
+                    dirty.append(previous[0])
+        for sprite, (rect, image) in self.sprite_rects.items():
+            if sprite not in current:
+                dirty.append(rect)
+        self.sprite_rects = current
+        self.camera_pos = camera.topleft
+        self.force_full = False
+        return dirty
+
+class Presenter:
+    """Shows the logical screen surface on the display, upscaling it when the two differ"""
+    def __init__(self, display, screen, integer_scaling=INTEGER_SCALING):
+        self.display = display
+        self.screen = screen
+        self.target = None  # Display subsurface the logical screen is scaled into
+        self.full_update = True  # Repaint the letterbox borders on the first present
+
+        display_width, display_height = display.get_size()
+        screen_width, screen_height = screen.get_size()
+        if display is screen:
+            self.scale = 1
+        elif integer_scaling:
+            self.scale = max(1, min(display_width // screen_width, display_height // screen_height))
+        else:
+            self.scale = min(display_width / screen_width, display_height / screen_height)
+
+        size = (int(screen_width * self.scale), int(screen_height * self.scale))
+        self.viewport = pygame.Rect((0, 0), size)
+        self.viewport.center = display.get_rect().center
+        if display is not screen:
+            display.fill(BLACK)
+            self.target = display.subsurface(self.viewport)
+
+    def to_display(self, rect):
+        """Map a logical screen rect to the display rect it covers after scaling"""
+        left = int(rect.left * self.scale) + self.viewport.x
+        top = int(rect.top * self.scale) + self.viewport.y
+        right = int(rect.right * self.scale + 0.999) + self.viewport.x
+        bottom = int(rect.bottom * self.scale + 0.999) + self.viewport.y
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def to_screen(self, pos):
+        """Map a display position (e.g. the mouse) to logical screen coordinates"""
+        return (int((pos[0] - self.viewport.x) / self.scale), int((pos[1] - self.viewport.y) / self.scale))
+
+    def present(self, rects=None):
+        """Scale the frame into the display once and flip the changed area (all of it when rects is None)"""
+        if self.target is None:
+            pygame.display.update(rects)
+            return
+        pygame.transform.scale(self.screen, self.viewport.size, self.target)
+        if self.full_update:
+            self.full_update = False
+            pygame.display.update()
+        elif rects is None:
+            pygame.display.update(self.viewport)
+        else:
+            pygame.display.update([self.to_display(rect) for rect in rects])
@@ -0,0 +1,21 @@
+import time
+from config import *
+
+class AIScheduler:
+    """Spreads enemy decisions (flow field and route lookups, line of sight) over ticks under a time budget;
+    steering toward the last decided target still runs every tick"""
+    def __init__(self, budget_ms=AI_THINK_BUDGET_MS):
+        self.budget = budget_ms / 1000
+
+    def think(self, enemies, tick):
+        """Let enemies pick new targets until the budget runs out: first those without a usable target,
+        then the ones that have waited longest, so everyone gets a turn"""
+        deadline = time.perf_counter() + self.budget
+        for enemy in sorted(enemies, key=self.priority):
+            enemy.target = enemy.chase_target()
+            enemy.decided_tick = tick
+            if time.perf_counter() >= deadline:
+                break
+
+    def priority(self, enemy):
+        return (not enemy.needs_target(), enemy.decided_tick)
@@ -0,0 +1,50 @@
+from config import *
+
+class SightLines:
+    """Tile-to-tile line of sight over the wall grid, memoised per (viewer tile, target tile)
+    until a tile opens or closes"""
+    def __init__(self, grid, cache_size=SIGHT_CACHE_SIZE):
+        self.grid = grid
+        self.cache_size = cache_size
+        self.cache = {}  # (viewer tile, target tile) -> True if nothing solid lies between them
+        self.built_version = grid.version
+
+    def can_see(self, viewer, target):
+        """Check if a straight line from viewer to target crosses no solid tile"""
+        if self.built_version != self.grid.version:
+            self.cache = {}
+            self.built_version = self.grid.version
+        key = (viewer, target)
+        seen = self.cache.get(key)
+        if seen is not None:
+            return seen
+        if len(self.cache) >= self.cache_size:
+            self.cache = {}  # Entries for old player tiles are rarely asked again, so start over
+        seen = self.cache[key] = self.trace(viewer, target)
+        return seen
+
+    def trace(self, viewer, target):
+        """Walk the Bresenham line between the two tiles; diagonal steps between two walls are blocked too"""
+        col, row = viewer
+        end_col, end_row = target
+        dx = abs(end_col - col)
+        dy = -abs(end_row - row)
+        step_x = 1 if col < end_col else -1
+        step_y = 1 if row < end_row else -1
+        error = dx + dy
+        is_solid = self.grid.is_solid
+        while (col, row) != (end_col, end_row):
+            double = error * 2
+            next_col, next_row = col, row
+            if double >= dy:
+                error += dy
+                next_col += step_x
+            if double <= dx:
+                error += dx
+                next_row += step_y
+            if next_col != col and next_row != row and is_solid(next_col, row) and is_solid(col, next_row):
+                return False
+            col, row = next_col, next_row
+            if (col, row) != (end_col, end_row) and is_solid(col, row):
+                return False
+        return True
@@ -0,0 +1,65 @@
+import pygame
+from config import *
+
+class SpatialHash(pygame.sprite.AbstractGroup):
+    """Sprite group bucketed by a uniform grid, so queries only visit the cells around the query area"""
+    def __init__(self, *sprites, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.buckets = {}  # (cell_x, cell_y) -> dict used as an insertion-ordered set of sprites
+        self.sprite_cells = {}  # Sprite -> (first_x, first_y, last_x, last_y) cell range it is bucketed in
+        super().__init__()
+        self.add(*sprites)
+
+    def cell_range(self, rect):
+        """Cells a rect touches, as an inclusive (first_x, first_y, last_x, last_y) range"""
+        size = self.cell_size
+        return (rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def cells(self, cell_range):
+        first_x, first_y, last_x, last_y = cell_range
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                yield cell_x, cell_y
+
+    def add_internal(self, sprite, layer=None):
+        """Bucket a sprite by its current rect; add sprites only once their rect is set"""
+        super().add_internal(sprite)
+        cell_range = self.cell_range(sprite.rect)
+        self.sprite_cells[sprite] = cell_range
+        for cell in self.cells(cell_range):
+            self.buckets.setdefault(cell, {})[sprite] = None
+
+    def remove_internal(self, sprite):
+        """Drop a sprite from every bucket it is in"""
+        super().remove_internal(sprite)
+        cell_range = self.sprite_cells.pop(sprite, None)
+        if cell_range is None:
+            return
+        for cell in self.cells(cell_range):
+            bucket = self.buckets[cell]
+            del bucket[sprite]
+            if not bucket:
+                del self.buckets[cell]
+
+    def move(self, sprite):
+        """Re-bucket a sprite after its rect moved; cheap when it stayed within the same cells"""
+        if sprite in self.sprite_cells and self.cell_range(sprite.rect) != self.sprite_cells[sprite]:
+            self.remove_internal(sprite)
+            self.add_internal(sprite)
+
+    def query_rect(self, rect, mask=COLLIDE_ALL):
+        """Sprites on a collision layer in mask whose rect overlaps rect"""
+        found = {}
+        for cell in self.cells(self.cell_range(rect)):
+            for sprite in self.buckets.get(cell, ()):
+                if sprite.collision_layer & mask and rect.colliderect(sprite.rect):
+                    found[sprite] = None
+        return list(found)
+
+    def query_radius(self, center, radius, mask=COLLIDE_ALL):
+        """Sprites on a collision layer in mask whose rect center is within radius of center"""
+        x, y = center
+        area = pygame.Rect(x - radius, y - radius, radius * 2 + 1, radius * 2 + 1)
+        radius_sq = radius * radius
+        return [sprite for sprite in self.query_rect(area, mask)
+                if (sprite.rect.centerx - x) ** 2 + (sprite.rect.centery - y) ** 2 <= radius_sq]
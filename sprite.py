@@ -3,17 +3,80 @@ from config import *
 import random
 import math
 from inventory import *
+from fonts import get_font, render_text
+from animation import *
+from atlas import region_name
+from triggers import Interactable
+
+# Frame positions shared by the knight, zombie and devil sheets, indexed by Direction (idle frame first)
+WALK_FRAMES = (
+    ((3, 2), (35, 2), (68, 2)),     # Down
+    ((3, 34), (35, 34), (68, 34)),  # Up
+    ((3, 98), (35, 98), (68, 98)),  # Left
+    ((3, 66), (35, 66), (68, 66)),  # Right
+)
+
+ATTACK_FRAMES = (
+    ((0, 32), (32, 32), (64, 32), (96, 32), (128, 32)),  # Down
+    ((0, 0), (32, 0), (64, 0), (96, 0), (128, 0)),       # Up
+    ((0, 96), (32, 96), (64, 96), (96, 96), (128, 96)),  # Left
+    ((0, 64), (32, 64), (64, 64), (96, 64), (128, 64)),  # Right
+)
+
+CHEST_FRAMES = ((0, 0), (0, 32))  # Closed, open
+
+PLAYER_TARGET = 'player'  # Enemy target meaning "wherever the player is now", resolved every tick
+
+# Every sheet region the game draws; `python atlas.py` packs exactly these into the atlas
+SHEET_REGIONS = {
+    'img/knight.png': WALK_FRAMES,
+    'img/zombie.png': WALK_FRAMES,
+    'img/devil.png': WALK_FRAMES,
+    'img/attack.png': ATTACK_FRAMES,
+    'img/chest.png': (CHEST_FRAMES,),
+    'img/terrain2.png': ((GROUND_TILE, BLOCK_TILE),),
+}
+
+# Process-wide frame atlas: every (sheet, region) is sliced once and the surface is shared.
+# Shared frames must never be drawn on; copy() them first.
+frame_cache = {}
+animation_cache = {}
+item_image_cache = {}
 
 class Spritesheet:
+    atlas = None  # Packed Atlas shared by every sheet, set by the game once loaded
+
     def __init__(self, file):
-        self.sheet = pygame.image.load(file).convert()
+        self.file = file
+        self.sheet = None  # Loose sheet, only loaded for regions the atlas lacks
 
     def get_sprite(self, x, y, width, height):
-        sprite = pygame.Surface((width, height))
-        sprite.blit(self.sheet, (0, 0), (x, y, width, height))
-        sprite.set_colorkey(BLACK)
+        """Return the shared frame for a sheet region, slicing it on first use"""
+        key = (self.file, x, y, width, height)
+        sprite = frame_cache.get(key)
+        if sprite is None:
+            name = region_name(*key)
+            if self.atlas and name in self.atlas:
+                sprite = self.atlas.get_frame(name)
+            else:
+                if self.sheet is None:
+                    self.sheet = pygame.image.load(self.file).convert()
+                sprite = pygame.Surface((width, height)).convert()
+                sprite.blit(self.sheet, (0, 0), (x, y, width, height))
+                sprite.set_colorkey(BLACK, pygame.RLEACCEL)
+            frame_cache[key] = sprite
         return sprite
 
+    def get_animations(self, frames, width, height):
+        """Return shared per-direction frame tuples for a table of frame positions"""
+        key = (self.file, frames, width, height)
+        animations = animation_cache.get(key)
+        if animations is None:
+            animations = tuple(tuple(self.get_sprite(x, y, width, height) for x, y in positions)
+                               for positions in frames)
+            animation_cache[key] = animations
+        return animations
+
 class Player(pygame.sprite.Sprite):
     def __init__(self, game, x, y):
 
@@ -30,8 +93,7 @@ class Player(pygame.sprite.Sprite):
         self.x_change = 0
         self.y_change = 0
 
-        self.facing = 'down'
-        self.animation_loop = 1
+        self.facing = Direction.DOWN
 
         # HP and Mana System
         self.max_hp = MAX_HP
@@ -42,29 +104,16 @@ class Player(pygame.sprite.Sprite):
         # Damage cooldown system
         self.damage_cooldown = 0
 
-        self.image = self.game.character_spritesheet.get_sprite(3, 2, self.width, self.height)
+        frames = self.game.character_spritesheet.get_animations(WALK_FRAMES, self.width, self.height)
+        self.animator = Animator(frames, CHARACTER_SEQUENCES)
+        self.image = frames[Direction.DOWN][0]
 
         self.rect = self.image.get_rect()
         self.rect.x = self.x
         self.rect.y = self.y
 
-        self.down_animations = [self.game.character_spritesheet.get_sprite(3, 2, self.width, self.height),
-                           self.game.character_spritesheet.get_sprite(35, 2, self.width, self.height),
-                           self.game.character_spritesheet.get_sprite(68, 2, self.width, self.height)]
-
-        self.up_animations = [self.game.character_spritesheet.get_sprite(3, 34, self.width, self.height),
-                         self.game.character_spritesheet.get_sprite(35, 34, self.width, self.height),
-                         self.game.character_spritesheet.get_sprite(68, 34, self.width, self.height)]
-
-        self.left_animations = [self.game.character_spritesheet.get_sprite(3, 98, self.width, self.height),
-                           self.game.character_spritesheet.get_sprite(35, 98, self.width, self.height),
-                           self.game.character_spritesheet.get_sprite(68, 98, self.width, self.height)]
-
-        self.right_animations = [self.game.character_spritesheet.get_sprite(3, 66, self.width, self.height),
-                            self.game.character_spritesheet.get_sprite(35, 66, self.width, self.height),
-                            self.game.character_spritesheet.get_sprite(68, 66, self.width, self.height)]
-
     def update(self):
+        self.prev_pos = self.rect.topleft  # Where the last tick left it, for render interpolation
         self.movement()
         self.animate()
         self.collide_enemy()
@@ -73,89 +122,50 @@ class Player(pygame.sprite.Sprite):
         if self.damage_cooldown > 0:
             self.damage_cooldown -= 1
 
-        self.rect.x += self.x_change
-        self.collide_blocks('x')
-        self.rect.y += self.y_change
-        self.collide_blocks('y')
+        self.move_and_slide()
+
+        self.collect_items()
 
         self.x_change = 0
         self.y_change = 0
 
+    def collect_items(self):
+        """Pick up the items the player is standing on"""
+        for item_sprite in self.game.spatial.query_rect(self.rect, COLLIDE_ITEM):
+            if self.game.inventory.add_item(item_sprite.item):
+                item_sprite.kill()
+
     def movement(self):
         keys = pygame.key.get_pressed()
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
             self.x_change -= PLAYER_SPEED
-            self.facing = 'left'
+            self.facing = Direction.LEFT
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
             self.x_change += PLAYER_SPEED
-            self.facing = 'right'
+            self.facing = Direction.RIGHT
         if keys[pygame.K_UP] or keys[pygame.K_w]:
             self.y_change -= PLAYER_SPEED
-            self.facing = 'up'
+            self.facing = Direction.UP
         if keys[pygame.K_DOWN] or keys[pygame.K_s]:
             self.y_change += PLAYER_SPEED
-            self.facing = 'down'
+            self.facing = Direction.DOWN
 
     def collide_enemy(self):
-        hits = pygame.sprite.spritecollide(self, self.game.enemies, False)
+        hits = self.game.spatial.query_rect(self.rect, COLLIDE_ENEMY)
         if hits and self.damage_cooldown <= 0:
             self.take_damage(1)  # Take 1 damage instead of dying instantly
             self.damage_cooldown = DAMAGE_COOLDOWN  # Set cooldown
 
-    def collide_blocks(self, direction):
-        if direction == 'x':
-            hits = pygame.sprite.spritecollide(self, self.game.blocks, False)
-            if hits:
-                if self.x_change > 0:
-                    self.rect.x = hits[0].rect.left - self.rect.width
-                if self.x_change < 0:
-                    self.rect.x = hits[0].rect.right
-
-        if direction == 'y':
-            hits = pygame.sprite.spritecollide(self, self.game.blocks, False)
-            if hits:
-                if self.y_change > 0:
-                    self.rect.y = hits[0].rect.top - self.rect.height
-                if self.y_change < 0:
-                    self.rect.y = hits[0].rect.bottom
+    def move_and_slide(self):
+        """Sweep the sub-pixel position through the tile grid, then snap the rect to it"""
+        self.x, self.y = self.game.grid.move(self.x, self.y, self.rect.width, self.rect.height, self.x_change, self.y_change)
+        self.rect.x = round(self.x)
+        self.rect.y = round(self.y)
 
     def animate(self):
-
-        if self.facing == 'down':
-            if self.y_change == 0:
-                self.image = self.game.character_spritesheet.get_sprite(3, 2, self.width, self.height)
-            else:
-                self.image = self.down_animations[math.floor(self.animation_loop)]
-                self.animation_loop += 0.1
-                if self.animation_loop >= 3:
-                    self.animation_loop = 1
-
-        if self.facing == 'up':
-            if self.y_change == 0:
-                self.image = self.game.character_spritesheet.get_sprite(3, 34, self.width, self.height)
-            else:
-                self.image = self.up_animations[math.floor(self.animation_loop)]
-                self.animation_loop += 0.1
-                if self.animation_loop >= 3:
-                    self.animation_loop = 1
-
-        if self.facing == 'left':
-            if self.x_change == 0:
-                self.image = self.game.character_spritesheet.get_sprite(3, 98, self.width, self.height)
-            else:
-                self.image = self.left_animations[math.floor(self.animation_loop)]
-                self.animation_loop += 0.1
-                if self.animation_loop >= 3:
-                    self.animation_loop = 1
-
-        if self.facing == 'right':
-            if self.x_change == 0:
-                self.image = self.game.character_spritesheet.get_sprite(3, 66, self.width, self.height)
-            else:
-                self.image = self.right_animations[math.floor(self.animation_loop)]
-                self.animation_loop += 0.1
-                if self.animation_loop >= 3:
-                    self.animation_loop = 1
+        # Walking only counts along the axis the sprite is facing
+        moving = (self.x_change, self.y_change)[DIRECTION_AXIS[self.facing]] != 0
+        self.image = self.animator.frame(self.facing, AnimState.WALK if moving else AnimState.IDLE)
 
     def can_attack(self):
         """Check if player has enough mana to attack"""
@@ -193,8 +203,11 @@ class Player(pygame.sprite.Sprite):
             return True
         return False
 
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self, game, x, y):
+class ChasingEnemy(pygame.sprite.Sprite):
+    """Shared body of the enemies: decides where to go, then steers and slides toward it tick by tick"""
+    collision_layer = COLLIDE_ENEMY
+
+    def __init__(self, game, x, y, spritesheet):
         self.game = game
         self._layer = ENEMY_LAYER
         self.groups = self.game.all_sprites, self.game.enemies
@@ -207,333 +220,162 @@ class Enemy(pygame.sprite.Sprite):
 
         # AI Pathfinding attributes
         self.speed = ENEMY_SPEED
-        self.detection_range = 80  # pixels (increased from 50 for better gameplay)
+        self.detection_range = ENEMY_DETECTION_STEPS  # Path length in tiles through the flow field
+        self.alerted = False  # Saw the player, and keeps chasing while they stay within range
+        self.waypoint = None  # Tile currently being walked to
+        self.target = None  # Point picked by the last decision (or PLAYER_TARGET), steered toward every tick
+        self.decided_tick = -1  # Game tick of the last decision, so the AI scheduler can take turns
 
         self.x_change = 0
         self.y_change = 0
 
-        self.facing = random.choice(['left', 'right', 'up', 'down'])
-        self.animation_loop = 1
+        self.facing = random.choice(list(Direction))
 
-        self.image = self.game.enemy_spritesheet.get_sprite(3, 2, self.width, self.height)
-        self.image.set_colorkey(BLACK)
+        frames = spritesheet.get_animations(WALK_FRAMES, self.width, self.height)
+        self.animator = Animator(frames, CHARACTER_SEQUENCES)
+        self.image = frames[Direction.DOWN][0]
         self.rect = self.image.get_rect()
         self.rect.x = self.x
         self.rect.y = self.y
-
-        self.down_animations = [self.game.enemy_spritesheet.get_sprite(3, 2, self.width, self.height),
-                           self.game.enemy_spritesheet.get_sprite(35, 2, self.width, self.height),
-                           self.game.enemy_spritesheet.get_sprite(68, 2, self.width, self.height)]
-
-        self.up_animations = [self.game.enemy_spritesheet.get_sprite(3, 34, self.width, self.height),
-                         self.game.enemy_spritesheet.get_sprite(35, 34, self.width, self.height),
-                         self.game.enemy_spritesheet.get_sprite(68, 34, self.width, self.height)]
-
-        self.left_animations = [self.game.enemy_spritesheet.get_sprite(3, 98, self.width, self.height),
-                           self.game.enemy_spritesheet.get_sprite(35, 98, self.width, self.height),
-                           self.game.enemy_spritesheet.get_sprite(68, 98, self.width, self.height)]
-
-        self.right_animations = [self.game.enemy_spritesheet.get_sprite(3, 66, self.width, self.height),
-                            self.game.enemy_spritesheet.get_sprite(35, 66, self.width, self.height),
-                            self.game.enemy_spritesheet.get_sprite(68, 66, self.width, self.height)]
-
-    def update(self):
-        """Update enemy with AI pathfinding logic"""
-        if self.game.player:
-            self.update_ai()
-            self.animate()
-
-            # Apply movement with collision detection
-            self.rect.x += self.x_change
-            self.collide_blocks('x')
-            self.rect.y += self.y_change
-            self.collide_blocks('y')
-
-            self.x_change = 0
-            self.y_change = 0
-
-    def update_ai(self):
-        """Update enemy AI logic"""
-        if self.game.player:
-            player_x = self.game.player.rect.centerx
-            player_y = self.game.player.rect.centery
-
-            # Calculate distance to player
-            distance = math.sqrt((player_x - self.rect.centerx) **2 + (player_y - self.rect.centery) **2)
-
-            # If player is within detection range, follow them
-            if distance <= self.detection_range and distance > 0:
-                # Calculate direction vector (normalized)
-                direction_x = (player_x - self.rect.centerx) / distance
-                direction_y = (player_y - self.rect.centery) / distance
-
-                # Move towards player
-                self.x_change = direction_x * self.speed
-                self.y_change = direction_y * self.speed
-
-                # Update facing direction based on movement
-                if abs(self.x_change) > abs(self.y_change):
-                    if self.x_change > 0:
-                        self.facing = 'right'
-                    else:
-                        self.facing = 'left'
+        self.game.spatial.add(self)
+
+    def next_step(self, col, row):
+        """Tile to walk onto toward the player, or None to stand still"""
+        step = self.route_step(col, row)
+        if step is None:
+            self.alerted = False
+        elif not self.alerted:
+            # Notice the player only along a clear line of sight; once alerted, follow the path around corners
+            self.alerted = self.sees_player(col, row)
+        return step if self.alerted else None
+
+    def route_step(self, col, row):
+        """Tile toward the player along the flow field, or None beyond detection range; subclasses reach further"""
+        return self.game.flow_field.next_tile(col, row, self.detection_range)
+
+    def sees_player(self, col, row):
+        """Check for a clear line of sight from a tile to the player's tile"""
+        return self.game.sight.can_see((col, row), self.game.flow_field.origin)
+
+    def chase_target(self):
+        """Decide what to steer toward: a point, PLAYER_TARGET, or the body's own center when the player is out of range"""
+        field = self.game.flow_field
+        col = self.rect.centerx // TILESIZE
+        row = self.rect.centery // TILESIZE
+        step = self.next_step(col, row)
+        if step is None:
+            # If player is outside range, enemy stands still
+            self.waypoint = None
+            return self.x + self.rect.width / 2, self.y + self.rect.height / 2
+        if step == field.origin:
+            # Next to the player: head straight for them, following them between decisions
+            self.waypoint = None
+            return PLAYER_TARGET
+        # Walk tile center to tile center, committing to one tile at a time so the body never clips a corner
+        if self.waypoint is None or self.at_tile(self.waypoint):
+            self.waypoint = step if self.at_tile((col, row)) else (col, row)
+        return self.waypoint[0] * TILESIZE + TILESIZE // 2, self.waypoint[1] * TILESIZE + TILESIZE // 2
+
+    def steer_target(self):
+        """Point to steer toward this tick: the live player position when closing in on them, the decided target,
+        or the body's own center before the first decision"""
+        if self.target == PLAYER_TARGET:
+            return self.game.player.rect.center
+        if self.target is None:
+            return self.x + self.rect.width / 2, self.y + self.rect.height / 2
+        return self.target
+
+    def steer(self, target_x, target_y, ticks=1):
+        """Set this tick's movement and facing toward a target; SteeringBatch does the same for many enemies at once"""
+        # Calculate distance to the target from the sub-pixel center
+        center_x = self.x + self.rect.width / 2
+        center_y = self.y + self.rect.height / 2
+        distance = math.sqrt((target_x - center_x) **2 + (target_y - center_y) **2)
+
+        if distance > 0:
+            # Calculate direction vector (normalized)
+            direction_x = (target_x - center_x) / distance
+            direction_y = (target_y - center_y) / distance
+
+            # Move towards the target without overshooting it
+            travel = min(self.speed * ticks, distance)
+            self.x_change = direction_x * travel
+            self.y_change = direction_y * travel
+
+            # Update facing direction based on movement
+            if abs(self.x_change) > abs(self.y_change):
+                if self.x_change > 0:
+                    self.facing = Direction.RIGHT
                 else:
-                    if self.y_change > 0:
-                        self.facing = 'down'
-                    else:
-                        self.facing = 'up'
+                    self.facing = Direction.LEFT
             else:
-                # If player is outside range, enemy stands still
-                self.x_change = 0
-                self.y_change = 0
-
-    def collide_blocks(self, direction):
-        if direction == 'x':
-            hits = pygame.sprite.spritecollide(self, self.game.blocks, False)
-            if hits:
-                if self.x_change > 0:
-                    self.rect.x = hits[0].rect.left - self.rect.width
-                    self.x_change = 0
-                if self.x_change < 0:
-                    self.rect.x = hits[0].rect.right
-                    self.x_change = 0
-        if direction == 'y':
-            hits = pygame.sprite.spritecollide(self, self.game.blocks, False)
-            if hits:
                 if self.y_change > 0:
-                    self.rect.y = hits[0].rect.top - self.rect.height
-                    self.y_change = 0
-                if self.y_change < 0:
-                    self.rect.y = hits[0].rect.bottom
-                    self.y_change = 0
-
-    def animate(self):
-        if self.facing == 'down':
-            if self.y_change == 0:
-                self.image = self.game.enemy_spritesheet.get_sprite(3, 2, self.width, self.height)
-            else:
-                self.image = self.down_animations[math.floor(self.animation_loop)]
-                self.animation_loop += 0.1
-                if self.animation_loop >= 3:
-                    self.animation_loop = 1
-
-        if self.facing == 'up':
-            if self.y_change == 0:
-                self.image = self.game.enemy_spritesheet.get_sprite(3, 34, self.width, self.height)
-            else:
-                self.image = self.up_animations[math.floor(self.animation_loop)]
-                self.animation_loop += 0.1
-                if self.animation_loop >= 3:
-                    self.animation_loop = 1
-
-        if self.facing == 'left':
-            if self.x_change == 0:
-                self.image = self.game.enemy_spritesheet.get_sprite(3, 98, self.width, self.height)
-            else:
-                self.image = self.left_animations[math.floor(self.animation_loop)]
-                self.animation_loop += 0.1
-                if self.animation_loop >= 3:
-                    self.animation_loop = 1
-
-        if self.facing == 'right':
-            if self.x_change == 0:
-                self.image = self.game.enemy_spritesheet.get_sprite(3, 66, self.width, self.height)
-            else:
-                self.image = self.right_animations[math.floor(self.animation_loop)]
-                self.animation_loop += 0.1
-                if self.animation_loop >= 3:
-                    self.animation_loop = 1
-
-class Devil(pygame.sprite.Sprite):
-    def __init__(self, game, x, y):
-        self.game = game
-        self._layer = ENEMY_LAYER
-        self.groups = self.game.all_sprites, self.game.enemies
-        pygame.sprite.Sprite.__init__(self, self.groups)
-
-        self.x = x * TILESIZE
-        self.y = y * TILESIZE
-        self.width = TILESIZE
-        self.height = TILESIZE
+                    self.facing = Direction.DOWN
+                else:
+                    self.facing = Direction.UP
+        else:
+            self.x_change = 0
+            self.y_change = 0
 
-        # AI Pathfinding attributes
-        self.speed = ENEMY_SPEED
-        self.detection_range = 80  # pixels (increased from 50 for better gameplay)
+    def apply_movement(self):
+        """Animate, then apply this tick's movement to the sub-pixel position, stopping at walls"""
+        self.animate()
+        self.move_and_slide()
+        self.game.spatial.move(self)
 
         self.x_change = 0
         self.y_change = 0
 
-        self.facing = random.choice(['left', 'right', 'up', 'down'])
-        self.animation_loop = 1
+    def needs_target(self):
+        """Check if the enemy has nothing to steer toward: no decision yet, or it reached its waypoint"""
+        return self.target is None or (self.waypoint is not None and self.at_tile(self.waypoint))
 
-        self.image = self.game.devil_spritesheet.get_sprite(3, 2, self.width, self.height)
-        self.image.set_colorkey(BLACK)
-        self.rect = self.image.get_rect()
-        self.rect.x = self.x
-        self.rect.y = self.y
+    def at_tile(self, tile):
+        """Check if the body sits exactly on a tile"""
+        return self.x == tile[0] * TILESIZE and self.y == tile[1] * TILESIZE
 
-        self.down_animations = [self.game.devil_spritesheet.get_sprite(3, 2, self.width, self.height),
-                           self.game.devil_spritesheet.get_sprite(35, 2, self.width, self.height),
-                           self.game.devil_spritesheet.get_sprite(68, 2, self.width, self.height)]
-
-        self.up_animations = [self.game.devil_spritesheet.get_sprite(3, 34, self.width, self.height),
-                         self.game.devil_spritesheet.get_sprite(35, 34, self.width, self.height),
-                         self.game.devil_spritesheet.get_sprite(68, 34, self.width, self.height)]
-
-        self.left_animations = [self.game.devil_spritesheet.get_sprite(3, 98, self.width, self.height),
-                           self.game.devil_spritesheet.get_sprite(35, 98, self.width, self.height),
-                           self.game.devil_spritesheet.get_sprite(68, 98, self.width, self.height)]
-
-        self.right_animations = [self.game.devil_spritesheet.get_sprite(3, 66, self.width, self.height),
-                            self.game.devil_spritesheet.get_sprite(35, 66, self.width, self.height),
-                            self.game.devil_spritesheet.get_sprite(68, 66, self.width, self.height)]
-
-    def update(self):
-        """Update enemy with AI pathfinding logic"""
-        if self.game.player:
-            self.update_ai()
-            self.animate()
-
-            # Apply movement with collision detection
-            self.rect.x += self.x_change
-            self.collide_blocks('x')
-            self.rect.y += self.y_change
-            self.collide_blocks('y')
-
-            self.x_change = 0
-            self.y_change = 0
-
-    def update_ai(self):
-        """Update enemy AI logic"""
-        if self.game.player:
-            player_x = self.game.player.rect.centerx
-            player_y = self.game.player.rect.centery
-
-            # Calculate distance to player
-            distance = math.sqrt((player_x - self.rect.centerx) **2 + (player_y - self.rect.centery) **2)
-
-            # If player is within detection range, follow them
-            if distance <= self.detection_range and distance > 0:
-                # Calculate direction vector (normalized)
-                direction_x = (player_x - self.rect.centerx) / distance
-                direction_y = (player_y - self.rect.centery) / distance
-
-                # Move towards player
-                self.x_change = direction_x * self.speed
-                self.y_change = direction_y * self.speed
-
-                # Update facing direction based on movement
-                if abs(self.x_change) > abs(self.y_change):
-                    if self.x_change > 0:
-                        self.facing = 'right'
-                    else:
-                        self.facing = 'left'
-                else:
-                    if self.y_change > 0:
-                        self.facing = 'down'
-                    else:
-                        self.facing = 'up'
-            else:
-                # If player is outside range, enemy stands still
-                self.x_change = 0
-                self.y_change = 0
-
-    def collide_blocks(self, direction):
-        if direction == 'x':
-            hits = pygame.sprite.spritecollide(self, self.game.blocks, False)
-            if hits:
-                if self.x_change > 0:
-                    self.rect.x = hits[0].rect.left - self.rect.width
-                    self.x_change = 0
-                if self.x_change < 0:
-                    self.rect.x = hits[0].rect.right
-                    self.x_change = 0
-        if direction == 'y':
-            hits = pygame.sprite.spritecollide(self, self.game.blocks, False)
-            if hits:
-                if self.y_change > 0:
-                    self.rect.y = hits[0].rect.top - self.rect.height
-                    self.y_change = 0
-                if self.y_change < 0:
-                    self.rect.y = hits[0].rect.bottom
-                    self.y_change = 0
+    def move_and_slide(self):
+        """Sweep the sub-pixel position through the tile grid, then snap the rect to it"""
+        self.x, self.y = self.game.grid.move(self.x, self.y, self.rect.width, self.rect.height, self.x_change, self.y_change)
+        self.rect.x = round(self.x)
+        self.rect.y = round(self.y)
 
     def animate(self):
-        if self.facing == 'down':
-            if self.y_change == 0:
-                self.image = self.game.devil_spritesheet.get_sprite(3, 2, self.width, self.height)
-            else:
-                self.image = self.down_animations[math.floor(self.animation_loop)]
-                self.animation_loop += 0.1
-                if self.animation_loop >= 3:
-                    self.animation_loop = 1
-
-        if self.facing == 'up':
-            if self.y_change == 0:
-                self.image = self.game.devil_spritesheet.get_sprite(3, 34, self.width, self.height)
-            else:
-                self.image = self.up_animations[math.floor(self.animation_loop)]
-                self.animation_loop += 0.1
-                if self.animation_loop >= 3:
-                    self.animation_loop = 1
-
-        if self.facing == 'left':
-            if self.x_change == 0:
-                self.image = self.game.devil_spritesheet.get_sprite(3, 98, self.width, self.height)
-            else:
-                self.image = self.left_animations[math.floor(self.animation_loop)]
-                self.animation_loop += 0.1
-                if self.animation_loop >= 3:
-                    self.animation_loop = 1
-
-        if self.facing == 'right':
-            if self.x_change == 0:
-                self.image = self.game.devil_spritesheet.get_sprite(3, 66, self.width, self.height)
-            else:
-                self.image = self.right_animations[math.floor(self.animation_loop)]
-                self.animation_loop += 0.1
-                if self.animation_loop >= 3:
-                    self.animation_loop = 1
+        # Walking only counts along the axis the sprite is facing
+        moving = (self.x_change, self.y_change)[DIRECTION_AXIS[self.facing]] != 0
+        self.image = self.animator.frame(self.facing, AnimState.WALK if moving else AnimState.IDLE)
 
-class Block(pygame.sprite.Sprite):
+class Enemy(ChasingEnemy):
+    """Zombie: chases along the flow field once it has seen the player"""
     def __init__(self, game, x, y):
-        self.game = game
-        self._layer = BLOCK_LAYER
-        self.groups = self.game.all_sprites, self.game.blocks
-        pygame.sprite.Sprite.__init__(self, self.groups)
-
-        self.x = x * TILESIZE
-        self.y = y * TILESIZE
-        self.width = TILESIZE
-        self.height = TILESIZE
-
-        self.image = self.game.terrain_spritesheet.get_sprite(960, 448, self.width, self.height)
-
-        self.rect = self.image.get_rect()
-        self.rect.x = self.x
-        self.rect.y = self.y
+        super().__init__(game, x, y, game.enemy_spritesheet)
 
-class Ground(pygame.sprite.Sprite):
+class Devil(ChasingEnemy):
+    """Devil: once it has seen the player, hunts them beyond the flow field along long-range routes"""
     def __init__(self, game, x, y):
-        self.game = game
-        self._layer = GROUND_LAYER
-        self.groups = self.game.all_sprites
-        pygame.sprite.Sprite.__init__(self, self.groups)
-
-        self.x = x * TILESIZE
-        self.y = y * TILESIZE
-        self.width = TILESIZE
-        self.height = TILESIZE
-
-        self.image = self.game.terrain_spritesheet.get_sprite(64, 352, self.width, self.height)
-
-        self.rect = self.image.get_rect()
-        self.rect.x = self.x
-        self.rect.y = self.y
+        super().__init__(game, x, y, game.devil_spritesheet)
+        self.hunt_range = DEVIL_HUNT_RANGE  # Alerted devils route to a player this many tiles away
+
+    def route_step(self, col, row):
+        step = super().route_step(col, row)
+        if step is None:
+            step = self.hunt_step(col, row)
+        return step
+
+    def hunt_step(self, col, row):
+        """Next tile on a long-range route to the player, planned only when the devil has reached a tile"""
+        goal = self.game.flow_field.origin
+        if goal is None or max(abs(goal[0] - col), abs(goal[1] - row)) > self.hunt_range:
+            return None
+        if not self.alerted and not self.sees_player(col, row):
+            return None  # Not worth planning a route the devil would not take
+        if self.waypoint is not None and not self.at_tile(self.waypoint):
+            return self.waypoint
+        return self.game.pathfinder.next_tile((col, row), goal)
 
 class Button:
     def __init__(self, x, y, width, height, fg, bg, content, fontsize):
-        self.font = pygame.font.Font('anime-ace.ttf', fontsize)
+        self.font = get_font('anime-ace.ttf', fontsize)
         self.content = content
 
         self.x = x
@@ -551,7 +393,7 @@ class Button:
         self.rect.x = self.x
         self.rect.y = self.y
 
-        self.text = self.font.render(self.content, True, self.fg)
+        self.text = render_text(self.font, self.content, self.fg, True)
         self.text_rect = self.text.get_rect(center=(self.width/2, self.height/2))
         self.image.blit(self.text, self.text_rect)
 
@@ -563,6 +405,8 @@ class Button:
         return False
 
 class Attack(pygame.sprite.Sprite):
+    collision_layer = COLLIDE_ATTACK
+
     def __init__(self, game, x, y):
         self.game = game
         self._layer = PLAYER_LAYER
@@ -574,76 +418,36 @@ class Attack(pygame.sprite.Sprite):
         self.width = TILESIZE
         self.height = TILESIZE
 
-        self.animation_loop = 0
-
-        self.image = self.game.attack_spritesheet.get_sprite(0, 0, self.width, self.height)
+        frames = self.game.attack_spritesheet.get_animations(ATTACK_FRAMES, self.width, self.height)
+        self.animator = Animator(frames, ATTACK_SEQUENCES)
+        self.image = frames[Direction.UP][0]
 
         self.rect = self.image.get_rect()
         self.rect.x = self.x
         self.rect.y = self.y
-
-        self.right_animations = [self.game.attack_spritesheet.get_sprite(0, 64, self.width, self.height),
-                           self.game.attack_spritesheet.get_sprite(32, 64, self.width, self.height),
-                           self.game.attack_spritesheet.get_sprite(64, 64, self.width, self.height),
-                           self.game.attack_spritesheet.get_sprite(96, 64, self.width, self.height),
-                           self.game.attack_spritesheet.get_sprite(128, 64, self.width, self.height)]
-
-        self.down_animations = [self.game.attack_spritesheet.get_sprite(0, 32, self.width, self.height),
-                           self.game.attack_spritesheet.get_sprite(32, 32, self.width, self.height),
-                           self.game.attack_spritesheet.get_sprite(64, 32, self.width, self.height),
-                           self.game.attack_spritesheet.get_sprite(96, 32, self.width, self.height),
-                           self.game.attack_spritesheet.get_sprite(128, 32, self.width, self.height)]
-
-        self.left_animations = [self.game.attack_spritesheet.get_sprite(0, 96, self.width, self.height),
-                           self.game.attack_spritesheet.get_sprite(32, 96, self.width, self.height),
-                           self.game.attack_spritesheet.get_sprite(64, 96, self.width, self.height),
-                           self.game.attack_spritesheet.get_sprite(96, 96, self.width, self.height),
-                           self.game.attack_spritesheet.get_sprite(128, 96, self.width, self.height)]
-
-        self.up_animations = [self.game.attack_spritesheet.get_sprite(0, 0, self.width, self.height),
-                         self.game.attack_spritesheet.get_sprite(32, 0, self.width, self.height),
-                         self.game.attack_spritesheet.get_sprite(64, 0, self.width, self.height),
-                         self.game.attack_spritesheet.get_sprite(96, 0, self.width, self.height),
-                         self.game.attack_spritesheet.get_sprite(128, 0, self.width, self.height)]
+        self.game.spatial.add(self)
 
     def update(self):
         self.animate()
         self.collide()
 
     def collide(self):
-        hits = pygame.sprite.spritecollide(self, self.game.enemies, True)
+        hits = self.game.spatial.query_rect(self.rect, COLLIDE_ENEMY)
+        for enemy in hits:
+            enemy.kill()
         if hits:
             self.kill()
 
     def animate(self):
-        direction = self.game.player.facing
-
-        if direction == 'up':
-            self.image = self.up_animations[math.floor(self.animation_loop)]
-            self.animation_loop += 0.5
-            if self.animation_loop >= 5:
-                self.kill()
-
-        if direction == 'down':
-            self.image = self.down_animations[math.floor(self.animation_loop)]
-            self.animation_loop += 0.5
-            if self.animation_loop >= 5:
-                self.kill()
-
-        if direction == 'left':
-            self.image = self.left_animations[math.floor(self.animation_loop)]
-            self.animation_loop += 0.5
-            if self.animation_loop >= 5:
-                self.kill()
-
-        if direction == 'right':
-            self.image = self.right_animations[math.floor(self.animation_loop)]
-            self.animation_loop += 0.5
-            if self.animation_loop >= 5:
-                self.kill()
+        # The slash follows the direction the player is currently facing
+        self.image = self.animator.frame(self.game.player.facing, AnimState.ATTACK)
+        if self.animator.finished:
+            self.kill()
 
 class ItemSprite(pygame.sprite.Sprite):
     """Base class for collectible items in the game world"""
+    collision_layer = COLLIDE_ITEM
+
     def __init__(self, game, x, y, item):
         self.game = game
         self._layer = ITEM_LAYER
@@ -663,6 +467,7 @@ class ItemSprite(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.x = self.x
         self.rect.y = self.y
+        self.game.spatial.add(self)  # The player picks items up through the spatial hash
 
     def get_item_color(self):
         """Return color based on item type"""
@@ -684,30 +489,32 @@ class ItemSprite(pygame.sprite.Sprite):
             return WHITE
 
     def get_item_image(self):
-        """Load and return the item's image"""
+        """Return the item's image, loading and scaling each icon only once"""
+        key = (self.item.icon, self.get_item_color(), self.width, self.height)
+        if key in item_image_cache:
+            return item_image_cache[key]
+
+        image = None
         if hasattr(self.item, 'icon') and self.item.icon:
             try:
-                # Load the image from the icon path
+                # Load the image from the icon path and scale to fit tile size
                 image = pygame.image.load(self.item.icon).convert_alpha()
-                # Scale to fit tile size
-                return pygame.transform.scale(image, (self.width, self.height))
+                image = pygame.transform.scale(image, (self.width, self.height))
             except (pygame.error, FileNotFoundError):
                 # Fallback to colored rectangle if image loading fails
-                pass
+                image = None
 
         # Fallback to colored rectangle if no icon or loading failed
-        fallback_image = pygame.Surface((self.width, self.height))
-        fallback_image.fill(self.get_item_color())
-        return fallback_image
-
-    def update(self):
-        """Check for collision with player"""
-        if pygame.sprite.collide_rect(self, self.game.player):
-            if self.game.inventory.add_item(self.item):
-                self.kill()
+        if image is None:
+            image = pygame.Surface((self.width, self.height))
+            image.fill(self.get_item_color())
+        item_image_cache[key] = image
+        return image
 
-class TreasureChest(pygame.sprite.Sprite):
+class TreasureChest(Interactable, pygame.sprite.Sprite):
     """Interactive treasure chest that opens when player presses E nearby"""
+    collision_layer = COLLIDE_CHEST
+
     def __init__(self, game, x, y):
         self.game = game
         self._layer = TREASURE_LAYER
@@ -720,15 +527,16 @@ class TreasureChest(pygame.sprite.Sprite):
         self.height = TILESIZE
 
         # Load closed chest sprite from chest.png (first 32x32 image)
-        self.image = self.game.chest_spritesheet.get_sprite(0, 0, self.width, self.height)
+        self.image = self.game.chest_spritesheet.get_sprite(*CHEST_FRAMES[0], self.width, self.height)
 
         self.rect = self.image.get_rect()
         self.rect.x = self.x
         self.rect.y = self.y
+        self.game.spatial.add(self)
 
-        # Treasure chest state
+        # Treasure chest state; the trigger volume around it replaces per-frame distance checks
         self.is_open = False
-        self.interaction_range = 50  # pixels
+        self.game.triggers.add(self, x, y)
 
         # Treasure chest contents (HP and Mana potions)
         self.contents = [
@@ -738,31 +546,30 @@ class TreasureChest(pygame.sprite.Sprite):
             ManaPotion()     # Blue mana potion
         ]
 
-    def update(self):
-        """Check for player interaction"""
-        if not self.is_open:
-            # Check if player is nearby and presses E
-            player_distance = math.sqrt(
-                (self.game.player.rect.centerx - self.rect.centerx)**2 +
-                (self.game.player.rect.centery - self.rect.centery)**2
-            )
-
-            if player_distance <= self.interaction_range:
-                keys = pygame.key.get_pressed()
-                if keys[pygame.K_e]:
-                    self.open_chest()
+    def on_enter(self):
+        """Show the open prompt while the player is in range"""
+        self.game.prompt_chest = self
+
+    def on_exit(self):
+        if self.game.prompt_chest is self:
+            self.game.prompt_chest = None
+
+    def on_interact(self):
+        self.open_chest()
+        return True
 
     def open_chest(self):
         """Open the treasure chest and show contents"""
         self.is_open = True
+        self.game.triggers.remove(self)  # An open chest never reacts again
         # Load opened chest sprite from chest.png (second 32x32 image below the first)
-        self.image = self.game.chest_spritesheet.get_sprite(0, 32, self.width, self.height)
+        self.image = self.game.chest_spritesheet.get_sprite(*CHEST_FRAMES[1], self.width, self.height)
 
         # Add all items to player's inventory
         for item in self.contents:
             self.game.inventory.add_item(item)
 
-class QuestionBarrier(pygame.sprite.Sprite):
+class QuestionBarrier(Interactable, pygame.sprite.Sprite):
     """Interactive barrier that opens when player answers riddle correctly"""
     def __init__(self, game, x, y):
         self.game = game
@@ -776,7 +583,7 @@ class QuestionBarrier(pygame.sprite.Sprite):
         self.height = TILESIZE
 
         # Use a distinct sprite for barrier (different from block)
-        self.image = self.game.terrain_spritesheet.get_sprite(64, 352, self.width, self.height)  # Use ground sprite but make it visible
+        self.image = self.game.terrain_spritesheet.get_sprite(*GROUND_TILE, self.width, self.height).copy()  # Copy the shared ground frame before tinting it
         # Add a colored overlay to make it distinct
         overlay = pygame.Surface((self.width, self.height))
         overlay.fill((255, 255, 0, 100))  # Semi-transparent yellow overlay
@@ -786,36 +593,20 @@ class QuestionBarrier(pygame.sprite.Sprite):
         self.rect.x = self.x
         self.rect.y = self.y
 
-        # Barrier state
+        # Barrier state; its 'Q' tile stays solid in the collision grid until it opens
         self.is_open = False
-        self.interaction_range = 50  # pixels
+        self.col = x
+        self.row = y
+        self.game.triggers.add(self, x, y)
 
         # Question data from config
         self.question = QUESTION_TEXT
         self.options = QUESTION_OPTIONS
         self.correct_answer = CORRECT_ANSWER  # Index of correct answer
 
-    def update(self):
-        """Check for player interaction and manage barrier state"""
-        if not self.is_open:
-            # Add to blocks if not already
-            if self not in self.game.blocks:
-                self.game.blocks.add(self)
-
-            # Check if player is nearby and presses E
-            player_distance = math.sqrt(
-                (self.game.player.rect.centerx - self.rect.centerx)**2 +
-                (self.game.player.rect.centery - self.rect.centery)**2
-            )
-
-            if player_distance <= self.interaction_range:
-                keys = pygame.key.get_pressed()
-                if keys[pygame.K_e]:
-                    self.show_question()
-        else:
-            # Remove from blocks if open
-            if self in self.game.blocks:
-                self.game.blocks.remove(self)
+    def on_interact(self):
+        self.show_question()
+        return True
 
     def show_question(self):
         """Show the question UI"""
@@ -827,11 +618,11 @@ class QuestionBarrier(pygame.sprite.Sprite):
         """Handle option selection"""
         if option_index == self.correct_answer:
             self.is_open = True
-            # Remove from blocks to allow passage
-            if self in self.game.blocks:
-                self.game.blocks.remove(self)
+            # Turn the tile into ground, which clears the grid cell and lets path caches rebuild around it
+            self.game.set_tile(self.col, self.row, '.')
+            self.game.triggers.remove(self)
             # Change appearance to indicate it's open (optional)
-            self.image = self.game.terrain_spritesheet.get_sprite(64, 352, self.width, self.height)  # Use ground sprite to indicate open
+            self.image = self.game.terrain_spritesheet.get_sprite(*GROUND_TILE, self.width, self.height)  # Use ground sprite to indicate open
         else:
             # Wrong answer - could add penalty here if desired
             pass
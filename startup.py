@@ -0,0 +1,27 @@
+import sys
+import time
+
+class StartupProfile:
+    """Checkpoints from process start to the first frame, printed when run with --profile-startup"""
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.begin = self.last = time.perf_counter()
+        self.sections = []  # (label, seconds since the previous checkpoint, seconds since start)
+
+    def mark(self, label):
+        """Close the section that started at the previous checkpoint"""
+        now = time.perf_counter()
+        self.sections.append((label, now - self.last, now - self.begin))
+        self.last = now
+
+    def report(self):
+        """Print the import and init breakdown if profiling was requested"""
+        if not self.enabled:
+            return
+        print("Startup profile:")
+        for label, seconds, elapsed in self.sections:
+            print(f"  {label:<24}{seconds * 1000:8.1f} ms  (at {elapsed * 1000:.0f} ms)")
+        print(f"  {'total':<24}{(self.last - self.begin) * 1000:8.1f} ms")
+
+# Imported first by main.py so the clock starts before any other module loads
+profile = StartupProfile('--profile-startup' in sys.argv)
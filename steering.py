@@ -0,0 +1,69 @@
+from itertools import chain
+from operator import attrgetter
+from config import *
+from animation import Direction
+
+try:
+    import numpy as np
+except ImportError:  # Optional: without NumPy every enemy steers itself
+    np = None
+
+DIRECTIONS = tuple(Direction)  # Facing code -> Direction
+
+def column(sprites, name):
+    """One attribute of every sprite as a float array; np.fromiter per attribute is several times faster than
+    building an array from per-sprite tuples"""
+    return np.fromiter(map(attrgetter(name), sprites), float, len(sprites))
+
+class SteeringBatch:
+    """Steers many enemies in one vectorized step: distances, chase vectors and facings toward their targets
+    are computed for all of them together in NumPy arrays and written back"""
+    def __init__(self, min_size=AI_BATCH_MIN_SIZE):
+        self.min_size = min_size  # Below this, per-array overhead outweighs the per-sprite Python it saves
+
+    def update(self, enemies, ticks):
+        """Move the given enemies toward their targets, enemies[i] covering ticks[i] ticks"""
+        if not enemies:
+            return
+        for enemy in enemies:
+            enemy.prev_pos = enemy.rect.topleft
+        targets = [enemy.steer_target() for enemy in enemies]
+        if np is None or len(enemies) < self.min_size:
+            for enemy, (target_x, target_y), enemy_ticks in zip(enemies, targets, ticks):
+                enemy.steer(target_x, target_y, enemy_ticks)
+        else:
+            self.steer(enemies, targets, ticks)
+        for enemy in enemies:
+            enemy.apply_movement()
+
+    def steer(self, enemies, targets, ticks):
+        """Vectorized twin of ChasingEnemy.steer"""
+        count = len(enemies)
+        center_x = column(enemies, 'x') + column(enemies, 'width') / 2
+        center_y = column(enemies, 'y') + column(enemies, 'height') / 2
+        reach = column(enemies, 'speed') * np.fromiter(ticks, float, count)
+        target = np.fromiter(chain.from_iterable(targets), float, count * 2)
+        offset_x = target[0::2] - center_x
+        offset_y = target[1::2] - center_y
+        distance = np.sqrt(offset_x ** 2 + offset_y ** 2)
+
+        # Move towards the target without overshooting it; enemies already there stay put
+        moving = distance > 0
+        travel = np.minimum(reach, distance)
+        safe_distance = np.where(moving, distance, 1.0)
+        changes = np.empty((count, 2))
+        changes[:, 0] = np.where(moving, offset_x / safe_distance * travel, 0.0)
+        changes[:, 1] = np.where(moving, offset_y / safe_distance * travel, 0.0)
+
+        # Facing codes: the dominant axis of movement, then its sign; -1 keeps the current facing
+        horizontal = np.abs(changes[:, 0]) > np.abs(changes[:, 1])
+        facing = np.where(horizontal,
+                          np.where(changes[:, 0] > 0, Direction.RIGHT, Direction.LEFT),
+                          np.where(changes[:, 1] > 0, Direction.DOWN, Direction.UP))
+        facing[~moving] = -1
+
+        for enemy, (x_change, y_change), code in zip(enemies, changes.tolist(), facing.tolist()):
+            enemy.x_change = x_change
+            enemy.y_change = y_change
+            if code >= 0:
+                enemy.facing = DIRECTIONS[code]
@@ -0,0 +1,74 @@
+import pygame
+from config import *
+
+class TerrainRenderer:
+    """Static ground and wall tiles baked into chunk surfaces once at load"""
+    def __init__(self, game, tiles, chunk_tiles=TERRAIN_CHUNK_TILES):
+        self.game = game
+        self.tiles = [list(row) for row in tiles]  # Mutable copy so single tiles can change later
+        self.rows = len(self.tiles)
+        self.cols = len(self.tiles[0])
+
+        self.chunk_tiles = chunk_tiles
+        self.chunk_size = chunk_tiles * TILESIZE
+        self.chunk_cols = (self.cols + chunk_tiles - 1) // chunk_tiles
+        self.chunk_rows = (self.rows + chunk_tiles - 1) // chunk_tiles
+
+        self.ground_image = self.game.terrain_spritesheet.get_sprite(*GROUND_TILE, TILESIZE, TILESIZE)
+        self.block_image = self.game.terrain_spritesheet.get_sprite(*BLOCK_TILE, TILESIZE, TILESIZE)
+
+        self.chunks = {}
+        self.version = 0  # Bumped on every tile change so dependent caches know to rebuild
+        self.bake()
+
+    def bake(self):
+        """Bake every chunk of the map"""
+        for chunk_y in range(self.chunk_rows):
+            for chunk_x in range(self.chunk_cols):
+                self.chunks[(chunk_x, chunk_y)] = self.bake_chunk(chunk_x, chunk_y)
+
+    def bake_chunk(self, chunk_x, chunk_y):
+        """Draw the tiles of one chunk into a single display-format surface"""
+        first_col = chunk_x * self.chunk_tiles
+        first_row = chunk_y * self.chunk_tiles
+        last_col = min(first_col + self.chunk_tiles, self.cols)
+        last_row = min(first_row + self.chunk_tiles, self.rows)
+
+        surface = pygame.Surface(((last_col - first_col) * TILESIZE, (last_row - first_row) * TILESIZE)).convert()
+        for row in range(first_row, last_row):
+            for col in range(first_col, last_col):
+                pos = ((col - first_col) * TILESIZE, (row - first_row) * TILESIZE)
+                surface.blit(self.ground_image, pos)
+                if self.tiles[row][col] == 'B':
+                    surface.blit(self.block_image, pos)
+        return surface
+
+    def tile_at(self, col, row):
+        """Return the tilemap character at a tile, or None outside the map"""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.tiles[row][col]
+        return None
+
+    def set_tile(self, col, row, char):
+        """Change a single tile and re-bake only the chunk that contains it"""
+        if self.tile_at(col, row) is None or self.tiles[row][col] == char:
+            return
+        self.tiles[row][col] = char
+        self.version += 1
+        chunk = (col // self.chunk_tiles, row // self.chunk_tiles)
+        self.chunks[chunk] = self.bake_chunk(*chunk)
+
+    def draw(self, surface, camera, view=None):
+        """Blit the chunks overlapping the view rect (the whole camera by default)"""
+        view = view or camera
+        first_x = max(0, view.left // self.chunk_size)
+        first_y = max(0, view.top // self.chunk_size)
+        last_x = min(self.chunk_cols - 1, (view.right - 1) // self.chunk_size)
+        last_y = min(self.chunk_rows - 1, (view.bottom - 1) // self.chunk_size)
+
+        visible = []
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                pos = (chunk_x * self.chunk_size - camera.x, chunk_y * self.chunk_size - camera.y)
+                visible.append((self.chunks[(chunk_x, chunk_y)], pos))
+        surface.blits(visible, False)
@@ -0,0 +1,72 @@
+from config import TILESIZE
+from collision import TileGrid
+
+def make_grid(rows):
+    """Grid from tilemap-style rows, 'B' for walls"""
+    return TileGrid.from_tiles(rows)
+
+def test_large_step_does_not_tunnel():
+    grid = make_grid(['..........B.....'])
+    # Far longer than a tile in one step; the wall at column 10 must still stop it
+    x, y = grid.move(0, 0, TILESIZE, TILESIZE, TILESIZE * 14, 0)
+    assert (x, y) == (10 * TILESIZE - TILESIZE, 0)
+
+def test_sweep_reports_time_axis_and_contact():
+    grid = make_grid(['....B'])
+    toi, axis, contact = grid.sweep(0, 0, TILESIZE, TILESIZE, 4 * TILESIZE, 0)
+    assert axis == 'x'
+    assert contact == 3 * TILESIZE
+    assert toi == 0.75
+
+def test_slides_along_wall():
+    grid = make_grid([
+        '..B',
+        '..B',
+        '..B',
+    ])
+    # Pressing into the wall on the right while moving down keeps all of the vertical motion
+    x, y = grid.move(TILESIZE - 4, 0, TILESIZE, TILESIZE, 10, 40)
+    assert x == TILESIZE
+    assert y == 40
+
+def test_corner_graze_passes():
+    grid = make_grid([
+        '...',
+        '...',
+        '..B',
+    ])
+    # Ends with its corner exactly on the wall's corner: touching is not overlapping
+    assert grid.move(0, 0, TILESIZE, TILESIZE, TILESIZE, TILESIZE) == (TILESIZE, TILESIZE)
+
+def test_corner_hit_on_both_axes_slides():
+    grid = make_grid([
+        '....',
+        '....',
+        '..B.',
+        '....',
+    ])
+    # Reaches the wall on both axes at the same time; the tie stops x and the rest of the step slides down
+    assert grid.move(0, 0, TILESIZE, TILESIZE, 2 * TILESIZE, 2 * TILESIZE) == (TILESIZE, 2 * TILESIZE)
+
+def test_touching_wall_cannot_enter_but_can_leave_or_slide():
+    grid = make_grid([
+        '.B',
+        '.B',
+    ])
+    assert grid.move(0, 0, TILESIZE, TILESIZE, 5, 0) == (0, 0)
+    assert grid.move(0, 0, TILESIZE, TILESIZE, 0, 7) == (0, 7)
+    grid = make_grid(['B...'])
+    assert grid.move(TILESIZE, 0, TILESIZE, TILESIZE, 6, 0) == (TILESIZE + 6, 0)
+
+def test_map_edge_is_solid():
+    grid = make_grid(['...'])
+    assert grid.move(0, 0, TILESIZE, TILESIZE, -50, 0) == (0, 0)
+    assert grid.move(0, 0, TILESIZE, TILESIZE, 0, 50) == (0, 0)
+
+def test_set_solid_logs_changes():
+    grid = make_grid(['...'])
+    grid.set_solid(1, 0)
+    grid.set_solid(1, 0)  # No change, nothing logged
+    grid.set_solid(1, 0, False)
+    assert grid.changes == [(1, 0), (1, 0)]
+    assert grid.version == 2
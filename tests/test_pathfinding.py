@@ -0,0 +1,105 @@
+import random
+from collision import TileGrid
+from pathfinding import HierarchicalPathfinder, local_search
+
+def maze(cols, rows, seed, density=0.25):
+    """Random walls on an open field, with a border so every test map is closed"""
+    rng = random.Random(seed)
+    lines = []
+    for row in range(rows):
+        line = ''
+        for col in range(cols):
+            edge = col in (0, cols - 1) or row in (0, rows - 1)
+            line += 'B' if edge or rng.random() < density else '.'
+        lines.append(line)
+    return TileGrid.from_tiles(lines)
+
+def open_tiles(grid):
+    return [(col, row) for row in range(grid.rows) for col in range(grid.cols) if not grid.is_solid(col, row)]
+
+def walk(pathfinder, start, goal, limit=1000):
+    """Follow next_tile from start; the number of steps to goal, or None if the pathfinder gives up"""
+    tile = start
+    steps = 0
+    while tile != goal and steps < limit:
+        step = pathfinder.next_tile(tile, goal)
+        if step is None:
+            return None
+        assert max(abs(step[0] - tile[0]), abs(step[1] - tile[1])) == 1
+        assert not pathfinder.grid.is_solid(*step)
+        tile = step
+        steps += 1
+    return steps if tile == goal else None
+
+def test_routes_match_reachability_and_stay_near_optimal():
+    grid = maze(40, 40, seed=1)
+    pathfinder = HierarchicalPathfinder(grid, cluster_tiles=8)
+    tiles = open_tiles(grid)
+    rng = random.Random(2)
+    full = (0, 0, grid.cols - 1, grid.rows - 1)
+    ratios = []
+    for _ in range(60):
+        start, goal = rng.sample(tiles, 2)
+        optimum = local_search(grid, start, full)
+        steps = walk(pathfinder, start, goal)
+        if goal not in optimum:
+            assert steps is None
+            continue
+        assert steps is not None
+        ratios.append(steps / optimum[goal][0])
+    assert ratios
+    assert max(ratios) <= 1.6
+    assert sum(ratios) / len(ratios) <= 1.15
+
+def test_route_cache_is_reused():
+    grid = maze(40, 40, seed=3)
+    pathfinder = HierarchicalPathfinder(grid, cluster_tiles=8, cache_size=4)
+    tiles = open_tiles(grid)
+    rng = random.Random(4)
+    for _ in range(20):
+        pathfinder.next_tile(*rng.sample(tiles, 2))
+    assert len(pathfinder.path_cache) <= 4
+
+def test_set_solid_rebuilds_only_nearby_clusters():
+    grid = maze(40, 40, seed=5, density=0.1)
+    pathfinder = HierarchicalPathfinder(grid, cluster_tiles=8)
+    tiles = open_tiles(grid)
+    rng = random.Random(6)
+    for _ in range(40):
+        pathfinder.next_tile(*rng.sample(tiles, 2))
+    cached = dict(pathfinder.path_cache)
+
+    rebuilt = []
+    build_cluster = pathfinder.build_cluster
+    pathfinder.build_cluster = lambda cluster: (rebuilt.append(cluster), build_cluster(cluster))
+    col, row = 20, 20
+    grid.set_solid(col, row, not grid.is_solid(col, row))
+    pathfinder.sync()
+
+    changed = pathfinder.cluster_of((col, row))
+    around = {(changed[0] + dx, changed[1] + dy) for dx, dy in ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1))}
+    assert set(rebuilt) == around
+    for key, (route, crossed) in cached.items():
+        touched = crossed & around or key[0] in around or key[1] in around
+        assert (key in pathfinder.path_cache) == (not touched)
+
+    # A second sync with no new changes rebuilds nothing
+    rebuilt.clear()
+    pathfinder.sync()
+    assert rebuilt == []
+
+def test_closing_a_gap_reroutes():
+    lines = [
+        'BBBBBBBBBBBBBBBBBBBB',
+        'B..................B',
+        'BBBBBBBBB.BBBBBBBBBB',
+        'B..................B',
+        'BBBBBBBBBBBBBBBBBBBB',
+    ]
+    grid = TileGrid.from_tiles(lines)
+    pathfinder = HierarchicalPathfinder(grid, cluster_tiles=5)
+    assert walk(pathfinder, (1, 1), (18, 3)) is not None
+    grid.set_solid(9, 2)
+    assert walk(pathfinder, (1, 1), (18, 3)) is None
+    grid.set_solid(9, 2, False)
+    assert walk(pathfinder, (1, 1), (18, 3)) is not None
@@ -0,0 +1,60 @@
+from config import *
+
+class Interactable:
+    """Mixin for sprites with a trigger volume; override the callbacks that matter"""
+    def on_enter(self):
+        """The player stepped onto a tile of this trigger volume"""
+
+    def on_exit(self):
+        """The player left the trigger volume"""
+
+    def on_interact(self):
+        """The player pressed E inside the trigger volume; return True if handled"""
+        return False
+
+class TriggerMap:
+    """Tile-indexed trigger volumes, checked only when the player changes tile"""
+    def __init__(self):
+        self.cells = {}  # (col, row) -> list of owners whose volume covers the tile
+        self.volumes = {}  # Owner -> tiles it covers
+        self.active = []  # Owners whose volume holds the player, in registration order
+        self.tile = None
+
+    def add(self, owner, col, row, radius=INTERACTION_TILE_RADIUS):
+        """Register a square volume of tiles within radius of (col, row)"""
+        tiles = [(c, r) for r in range(row - radius, row + radius + 1) for c in range(col - radius, col + radius + 1)]
+        self.volumes[owner] = tiles
+        for tile in tiles:
+            self.cells.setdefault(tile, []).append(owner)
+        if self.tile in tiles:
+            self.active.append(owner)
+            owner.on_enter()
+
+    def remove(self, owner):
+        """Unregister an owner; it gets on_exit if the player was inside"""
+        for tile in self.volumes.pop(owner, ()):
+            self.cells[tile].remove(owner)
+        if owner in self.active:
+            self.active.remove(owner)
+            owner.on_exit()
+
+    def update(self, col, row):
+        """Fire exit/enter callbacks if the player moved to another tile"""
+        if (col, row) == self.tile:
+            return
+        self.tile = (col, row)
+        inside = self.cells.get(self.tile, [])
+        for owner in [owner for owner in self.active if owner not in inside]:
+            self.active.remove(owner)
+            owner.on_exit()
+        for owner in inside:
+            if owner not in self.active:
+                self.active.append(owner)
+                owner.on_enter()
+
+    def interact(self):
+        """Pass an E press to the volumes holding the player until one handles it"""
+        for owner in list(self.active):
+            if owner.on_interact():
+                return True
+        return False
@@ -0,0 +1,234 @@
+from abc import ABC, abstractmethod
+import pygame
+from config import *
+from fonts import get_font, render_text, blit_wrapped
+
+class Overlay(ABC):
+    """UI panel composed once into a cached surface and re-composed only when its state changes"""
+    def __init__(self, game):
+        self.game = game
+        self.surface = None
+        self.state = None
+        self.pos = (0, 0)
+
+    def get_state(self):
+        """Return a hashable snapshot of everything the panel shows - override in subclasses"""
+        return None
+
+    @abstractmethod
+    def compose(self, state):
+        """Build and return the panel surface, setting self.pos"""
+
+    def draw(self, screen):
+        """Blit the cached panel, re-composing it first if its inputs changed"""
+        state = self.get_state()
+        if self.surface is None or state != self.state:
+            self.surface = self.compose(state)
+            self.state = state
+        screen.blit(self.surface, self.pos)
+        return self.surface.get_rect(topleft=self.pos)
+
+class HudOverlay(Overlay):
+    """HP and Mana bars in the top right corner"""
+    BAR_WIDTH = 200
+    BAR_HEIGHT = 25
+    MANA_OFFSET = 75  # Distance from the top of the HP bar to the top of the Mana bar
+
+    def get_state(self):
+        player = self.game.player
+        return (player.current_hp, player.max_hp, player.current_mana, player.max_mana, self.game.screen.get_width())
+
+    def compose(self, state):
+        current_hp, max_hp, current_mana, max_mana, screen_width = state
+        font = self.game.font
+        hp_text = render_text(font, f'{current_hp}/{max_hp}', WHITE)
+        mana_text = render_text(font, f'{current_mana}/{max_mana}', WHITE)
+        height = self.MANA_OFFSET + self.BAR_HEIGHT + 15 + mana_text.get_height() // 2 + 1
+        surface = pygame.Surface((self.BAR_WIDTH, height), pygame.SRCALPHA)
+
+        # HP Bar (Red background, green fill, black border)
+        pygame.draw.rect(surface, RED, (0, 0, self.BAR_WIDTH, self.BAR_HEIGHT))
+        pygame.draw.rect(surface, GREEN, (0, 0, int(self.BAR_WIDTH * current_hp / max_hp), self.BAR_HEIGHT))
+        pygame.draw.rect(surface, BLACK, (0, 0, self.BAR_WIDTH, self.BAR_HEIGHT), 3)
+        surface.blit(hp_text, hp_text.get_rect(center=(self.BAR_WIDTH // 2, self.BAR_HEIGHT + 15)))
+
+        # Mana Bar (Azure background, blue fill, black border)
+        mana_y = self.MANA_OFFSET
+        pygame.draw.rect(surface, AZURE_BLUE, (0, mana_y, self.BAR_WIDTH, self.BAR_HEIGHT))
+        pygame.draw.rect(surface, BLUE, (0, mana_y, int(self.BAR_WIDTH * current_mana / max_mana), self.BAR_HEIGHT))
+        pygame.draw.rect(surface, BLACK, (0, mana_y, self.BAR_WIDTH, self.BAR_HEIGHT), 3)
+        surface.blit(mana_text, mana_text.get_rect(center=(self.BAR_WIDTH // 2, mana_y + self.BAR_HEIGHT + 15)))
+
+        self.pos = (screen_width - 220, 50)  # Position bars at the top right
+        return surface
+
+class InventoryOverlay(Overlay):
+    """Inventory grid with its title and item count"""
+    def __init__(self, game):
+        super().__init__(game)
+        self.icons = {}  # Icon path -> scaled surface, or None if it failed to load
+
+    def get_icon(self, path):
+        """Load and scale an item icon once"""
+        if path not in self.icons:
+            try:
+                image = pygame.image.load(path).convert_alpha()
+                self.icons[path] = pygame.transform.scale(image, (INVENTORY_SLOT_SIZE - 4, INVENTORY_SLOT_SIZE - 4))
+            except (pygame.error, FileNotFoundError):
+                self.icons[path] = None
+        return self.icons[path]
+
+    def get_state(self):
+        inventory = self.game.inventory
+        items = tuple((item.icon, item.item_type, item.quantity) for item in inventory.items)
+        return (items, inventory.max_slots, self.game.screen.get_size())
+
+    def compose(self, state):
+        items, max_slots, (screen_width, screen_height) = state
+        font = self.game.font
+        title_text = render_text(font, "Inventory (Press I to close)", INVENTORY_TEXT_COLOR)
+        info_text = render_text(font, f"Items: {len(items)}/{max_slots}", INVENTORY_TEXT_COLOR)
+
+        # Title sits 40px above the grid and the item count 10px below it
+        width = max(INVENTORY_UI_WIDTH, title_text.get_width(), info_text.get_width())
+        height = 40 + INVENTORY_UI_HEIGHT + 10 + info_text.get_height()
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        grid_x = (width - INVENTORY_UI_WIDTH) // 2
+        grid_y = 40
+
+        # Semi-transparent background
+        surface.fill(INVENTORY_BG_COLOR, (grid_x, grid_y, INVENTORY_UI_WIDTH, INVENTORY_UI_HEIGHT))
+
+        for row in range(INVENTORY_ROWS):
+            for col in range(INVENTORY_COLS):
+                slot_x = grid_x + col * (INVENTORY_SLOT_SIZE + INVENTORY_SLOT_SPACING) + INVENTORY_SLOT_SPACING
+                slot_y = grid_y + row * (INVENTORY_SLOT_SIZE + INVENTORY_SLOT_SPACING) + INVENTORY_SLOT_SPACING
+
+                # Draw slot background and border
+                pygame.draw.rect(surface, INVENTORY_SLOT_COLOR, (slot_x, slot_y, INVENTORY_SLOT_SIZE, INVENTORY_SLOT_SIZE))
+                pygame.draw.rect(surface, INVENTORY_BORDER_COLOR, (slot_x, slot_y, INVENTORY_SLOT_SIZE, INVENTORY_SLOT_SIZE), 2)
+
+                item_index = row * INVENTORY_COLS + col
+                if item_index < len(items):
+                    icon, item_type, quantity = items[item_index]
+
+                    # Draw item icon, falling back to a colored rectangle
+                    item_image = self.get_icon(icon) if icon else None
+                    if item_image:
+                        surface.blit(item_image, (slot_x + 2, slot_y + 2))
+                    else:
+                        item_color = GREEN if item_type == "potion" else \
+                                    RED if item_type == "weapon" else \
+                                    (255, 215, 0) if item_type == "collectible" else WHITE
+                        pygame.draw.rect(surface, item_color,
+                                       (slot_x + 2, slot_y + 2, INVENTORY_SLOT_SIZE - 4, INVENTORY_SLOT_SIZE - 4))
+
+                    # Draw item count if > 1
+                    if quantity > 1:
+                        count_text = render_text(font, str(quantity), INVENTORY_ITEM_COUNT_COLOR)
+                        count_rect = count_text.get_rect(bottomright=(slot_x + INVENTORY_SLOT_SIZE - 2, slot_y + INVENTORY_SLOT_SIZE - 2))
+                        surface.blit(count_text, count_rect)
+
+        surface.blit(title_text, title_text.get_rect(centerx=width // 2, top=0))
+        surface.blit(info_text, info_text.get_rect(centerx=width // 2, top=grid_y + INVENTORY_UI_HEIGHT + 10))
+
+        self.pos = ((screen_width - width) // 2, (screen_height - INVENTORY_UI_HEIGHT) // 2 - grid_y)
+        return surface
+
+class MenuOverlay(Overlay):
+    """Full-screen in-game pause menu"""
+    LABELS = ["Save Game", "Music", "Return to Game", "Quit Game"]
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.button_rects = []
+        self.layout()
+
+    def layout(self):
+        """Compute button rects for the current screen size"""
+        screen_width, screen_height = self.game.screen.get_size()
+        self.button_rects = [
+            pygame.Rect((screen_width - MENU_BUTTON_WIDTH) // 2,
+                        screen_height // 2 - 100 + i * (MENU_BUTTON_HEIGHT + MENU_BUTTON_SPACING),
+                        MENU_BUTTON_WIDTH, MENU_BUTTON_HEIGHT)
+            for i in range(len(self.LABELS))
+        ]
+
+    def hovered_button(self):
+        """Index of the button under the mouse, or None"""
+        mouse_pos = self.game.mouse_pos()
+        for i, button_rect in enumerate(self.button_rects):
+            if button_rect.collidepoint(mouse_pos):
+                return i
+        return None
+
+    def get_state(self):
+        return (self.game.selected_button, self.hovered_button(), self.game.music_paused, self.game.screen.get_size())
+
+    def compose(self, state):
+        selected_button, hovered_button, music_paused, (screen_width, screen_height) = state
+        surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        surface.fill(MENU_BG_COLOR)
+
+        # Menu title
+        title_font = get_font('darkbyte.ttf', MENU_TITLE_FONT_SIZE)
+        title_text = render_text(title_font, "Game Menu", MENU_TEXT_COLOR)
+        surface.blit(title_text, title_text.get_rect(centerx=screen_width // 2, top=100))
+
+        # Menu buttons, highlighted when hovered or selected via keyboard
+        button_font = get_font('darkbyte.ttf', MENU_BUTTON_FONT_SIZE)
+        for i, button_rect in enumerate(self.button_rects):
+            text = self.LABELS[i]
+            if i == 1:
+                text += ": " + ("Off" if music_paused else "On")
+            button_color = MENU_BUTTON_HOVER_COLOR if i in (hovered_button, selected_button) else MENU_BUTTON_COLOR
+            pygame.draw.rect(surface, button_color, button_rect)
+            pygame.draw.rect(surface, WHITE, button_rect, 2)
+
+            button_text = render_text(button_font, text, MENU_TEXT_COLOR)
+            surface.blit(button_text, button_text.get_rect(center=button_rect.center))
+
+        # Instructions
+        instr_text = render_text(self.game.font, "Use Arrow/WASD keys to navigate, Enter to select, ESC to close", MENU_TEXT_COLOR)
+        surface.blit(instr_text, instr_text.get_rect(centerx=screen_width // 2, top=screen_height - 100))
+
+        self.pos = (0, 0)
+        return surface
+
+class QuestionOverlay(Overlay):
+    """Full-screen riddle prompt shown by a QuestionBarrier"""
+    def get_state(self):
+        barrier = self.game.question_barrier
+        return (barrier.question, tuple(barrier.options), self.game.selected_option, self.game.screen.get_size())
+
+    def compose(self, state):
+        question, options, selected_option, (screen_width, screen_height) = state
+        surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 150))
+
+        # Question box
+        box_width = QUESTION_UI_WIDTH
+        box_height = QUESTION_UI_HEIGHT
+        box_x = (screen_width - box_width) // 2
+        box_y = (screen_height - box_height) // 2
+        pygame.draw.rect(surface, (50, 50, 50), (box_x, box_y, box_width, box_height))
+        pygame.draw.rect(surface, WHITE, (box_x, box_y, box_width, box_height), 3)
+
+        # Question text, wrapped to fit inside the box
+        question_font = get_font('darkbyte.ttf', 24)
+        question_bottom = blit_wrapped(surface, question_font, question, WHITE, box_width - 40, screen_width // 2, box_y + 30)
+
+        # Options start below the question, however many lines it wrapped to
+        option_font = get_font('darkbyte.ttf', 20)
+        options_top = max(box_y + 100, question_bottom + 30)
+        for i, option in enumerate(options):
+            color = YELLOW if i == selected_option else WHITE
+            option_text = render_text(option_font, f"{chr(65 + i)}. {option}", color)
+            surface.blit(option_text, option_text.get_rect(centerx=screen_width // 2, top=options_top + i * 40))
+
+        # Instructions
+        instr_text = render_text(self.game.font, "Use Up/Down to navigate, Enter to select", WHITE)
+        surface.blit(instr_text, instr_text.get_rect(centerx=screen_width // 2, top=box_y + box_height - 50))
+
+        self.pos = (0, 0)
+        return surface